@@ -5,21 +5,164 @@ Handles saving and loading designs from SQLite database with user association
 
 import sqlite3
 import json
-from datetime import datetime
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeout
+from contextlib import contextmanager
 from pathlib import Path
 import streamlit as st
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional
 
 
 # Database path
 DB_PATH = Path(__file__).parent / "nano_bio.db"
 
+# Bumped whenever init_design_db() gains new DDL; stored in PRAGMA user_version
+_SCHEMA_VERSION = 2
+
+# Number of most recent versions kept per design
+_MAX_VERSIONS_PER_DESIGN = 20
+
+# Statement cache size per connection (sqlite3 default is 128)
+_CACHED_STATEMENTS = 256
+
+# How long the Save button waits on the background writer before reporting
+# the save as queued
+_SAVE_WAIT_SECONDS = 0.5
+
+# SQL statements, kept as module constants so the driver's statement cache
+# sees the same string on every call
+_SQL_BEGIN_WRITE = "BEGIN IMMEDIATE"
+
+_SQL_SELECT_DESIGN_ID = "SELECT id FROM user_designs WHERE username = ? AND design_name = ?"
+
+_SQL_INSERT_DESIGN = """
+    INSERT INTO user_designs 
+    (username, design_name, design_data, description, tags)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+_SQL_UPDATE_DESIGN = """
+    UPDATE user_designs 
+    SET design_data = ?, description = ?, updated_at = CURRENT_TIMESTAMP, tags = ?
+    WHERE id = ?
+"""
+
+_SQL_RESTORE_DESIGN = """
+    UPDATE user_designs 
+    SET design_data = ?, updated_at = CURRENT_TIMESTAMP
+    WHERE username = ? AND design_name = ?
+"""
+
+_SQL_SELECT_DESIGN_DATA = """
+    SELECT design_data FROM user_designs 
+    WHERE username = ? AND design_name = ?
+"""
+
+_SQL_LIST_DESIGNS = """
+    SELECT id, design_name, description, created_at, updated_at, 
+           is_favorite, tags
+    FROM user_designs 
+    WHERE username = ?
+    ORDER BY updated_at DESC
+"""
+
+_SQL_DELETE_DESIGN = "DELETE FROM user_designs WHERE id = ?"
+
+_SQL_SELECT_FAVORITE = "SELECT is_favorite FROM user_designs WHERE username = ? AND design_name = ?"
+
+_SQL_UPDATE_FAVORITE = """
+    UPDATE user_designs 
+    SET is_favorite = ?
+    WHERE username = ? AND design_name = ?
+"""
+
+_SQL_INSERT_VERSION = """
+    INSERT INTO design_versions 
+    (design_id, version_number, design_data, version_notes)
+    VALUES (?, ?, ?, ?)
+"""
+
+_SQL_MAX_VERSION = "SELECT MAX(version_number) FROM design_versions WHERE design_id = ?"
+
+_SQL_LIST_VERSIONS = """
+    SELECT v.version_number, v.design_data, v.version_notes, v.created_at
+    FROM design_versions v
+    JOIN user_designs d ON v.design_id = d.id
+    WHERE d.username = ? AND d.design_name = ?
+    ORDER BY v.version_number DESC
+"""
+
+_SQL_SELECT_VERSION_DATA = """
+    SELECT v.design_data
+    FROM design_versions v
+    JOIN user_designs d ON v.design_id = d.id
+    WHERE d.username = ? AND d.design_name = ? AND v.version_number = ?
+"""
+
+_SQL_COUNT_DESIGNS = "SELECT COUNT(*) FROM user_designs WHERE username = ?"
+
+_SQL_COUNT_FAVORITES = "SELECT COUNT(*) FROM user_designs WHERE username = ? AND is_favorite = 1"
+
+_SQL_COUNT_USER_VERSIONS = """
+    SELECT COUNT(*) FROM design_versions 
+    WHERE design_id IN (SELECT id FROM user_designs WHERE username = ?)
+"""
+
+
+def _get_conn() -> sqlite3.Connection:
+    """Open a connection to the design database with mapping-style rows."""
+    conn = sqlite3.connect(
+        DB_PATH, cached_statements=_CACHED_STATEMENTS, isolation_level=None
+    )
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+# Dedicated writer thread (SQLite allows a single writer at a time)
+_writer_state = threading.local()
+
+
+def _init_writer():
+    """Open the long-lived connection owned by the writer thread."""
+    _writer_state.conn = _get_conn()
+
+
+_WRITER = ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="design-writer", initializer=_init_writer
+)
+
+
+@contextmanager
+def _write_txn() -> Iterator[sqlite3.Cursor]:
+    """
+    Yield a cursor inside one BEGIN IMMEDIATE transaction.
+    
+    The write lock is taken up front so concurrent writers wait on the busy
+    timeout instead of failing mid-transaction; the transaction is committed
+    (one fsync) on normal exit and rolled back on error. The writer thread
+    reuses its own connection; other callers open one per transaction.
+    """
+    owned_conn = getattr(_writer_state, "conn", None)
+    conn = owned_conn or _get_conn()
+    try:
+        with conn:
+            conn.execute(_SQL_BEGIN_WRITE)
+            yield conn.cursor()
+    finally:
+        if conn is not owned_conn:
+            conn.close()
+
 
 def init_design_db():
     """Initialize the design database tables if they don't exist."""
-    conn = sqlite3.connect(DB_PATH)
+    conn = _get_conn()
     cursor = conn.cursor()
     
+    # Schema already in place - skip the DDL round-trips
+    if cursor.execute("PRAGMA user_version").fetchone()[0] >= _SCHEMA_VERSION:
+        conn.close()
+        return
+    
     # Create designs table
     cursor.execute("""
     CREATE TABLE IF NOT EXISTS user_designs (
@@ -67,6 +210,19 @@ def init_design_db():
     ON design_versions(design_id)
     """)
     
+    # Keep only the newest versions of each design
+    cursor.execute(f"""
+    CREATE TRIGGER IF NOT EXISTS trg_version_cap
+    AFTER INSERT ON design_versions
+    BEGIN
+        DELETE FROM design_versions
+        WHERE design_id = NEW.design_id
+          AND version_number <= NEW.version_number - {_MAX_VERSIONS_PER_DESIGN};
+    END
+    """)
+    
+    cursor.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+    
     conn.commit()
     conn.close()
 
@@ -87,61 +243,46 @@ def save_design_to_db(username: str, design_name: str, design_data: dict,
         True if successful, False otherwise
     """
     try:
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        
-        # Convert design_data to JSON
+        # Convert design_data to JSON (outside the write lock)
         design_json = json.dumps(design_data)
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        
-        # Check if design already exists
-        cursor.execute(
-            "SELECT id FROM user_designs WHERE username = ? AND design_name = ?",
-            (username, design_name)
-        )
-        existing = cursor.fetchone()
         
-        if existing:
-            # Update existing design
-            design_id = existing[0]
-            cursor.execute("""
-                UPDATE user_designs 
-                SET design_data = ?, description = ?, updated_at = ?, tags = ?
-                WHERE id = ?
-            """, (design_json, description, timestamp, tags, design_id))
-            
-            # Create version entry
-            cursor.execute(
-                "SELECT COUNT(*) FROM design_versions WHERE design_id = ?",
-                (design_id,)
-            )
-            version_num = cursor.fetchone()[0] + 1
+        with _write_txn() as cursor:
+            # Check if design already exists
+            cursor.execute(_SQL_SELECT_DESIGN_ID, (username, design_name))
+            existing = cursor.fetchone()
             
-            cursor.execute("""
-                INSERT INTO design_versions 
-                (design_id, version_number, design_data, version_notes)
-                VALUES (?, ?, ?, ?)
-            """, (design_id, version_num, design_json, "Auto-saved update"))
-            
-        else:
-            # Insert new design
-            cursor.execute("""
-                INSERT INTO user_designs 
-                (username, design_name, design_data, description, tags)
-                VALUES (?, ?, ?, ?, ?)
-            """, (username, design_name, design_json, description, tags))
-            
-            design_id = cursor.lastrowid
+            if existing:
+                # Update existing design
+                design_id = existing[0]
+                cursor.execute(
+                    _SQL_UPDATE_DESIGN, (design_json, description, tags, design_id)
+                )
+                
+                # Create version entry (older versions may have been pruned,
+                # so number from the latest rather than the row count)
+                cursor.execute(_SQL_MAX_VERSION, (design_id,))
+                version_num = (cursor.fetchone()[0] or 0) + 1
+                
+                cursor.execute(
+                    _SQL_INSERT_VERSION,
+                    (design_id, version_num, design_json, "Auto-saved update")
+                )
+                
+            else:
+                # Insert new design
+                cursor.execute(
+                    _SQL_INSERT_DESIGN,
+                    (username, design_name, design_json, description, tags)
+                )
+                
+                design_id = cursor.lastrowid
+                
+                # Create initial version
+                cursor.execute(
+                    _SQL_INSERT_VERSION,
+                    (design_id, 1, design_json, "Initial version")
+                )
             
-            # Create initial version
-            cursor.execute("""
-                INSERT INTO design_versions 
-                (design_id, version_number, design_data, version_notes)
-                VALUES (?, ?, ?, ?)
-            """, (design_id, 1, design_json, "Initial version"))
-        
-        conn.commit()
-        conn.close()
         return True
     
     except Exception as e:
@@ -149,6 +290,28 @@ def save_design_to_db(username: str, design_name: str, design_data: dict,
         return False
 
 
+def save_design_async(username: str, design_name: str, design_data: dict,
+                      description: str = "", tags: str = "") -> Future:
+    """
+    Queue a save on the background writer thread.
+    
+    Args:
+        username: Username of the designer
+        design_name: Name of the design
+        design_data: Dictionary containing all design parameters
+        description: Optional description of the design
+        tags: Optional comma-separated tags
+    
+    Returns:
+        Future resolving to the result of save_design_to_db
+    """
+    # Snapshot the design so later session edits don't race the write
+    return _WRITER.submit(
+        save_design_to_db, username, design_name, dict(design_data),
+        description, tags
+    )
+
+
 def load_design_from_db(username: str, design_name: str) -> Optional[dict]:
     """
     Load a design from the database.
@@ -161,13 +324,10 @@ def load_design_from_db(username: str, design_name: str) -> Optional[dict]:
         Design dictionary or None if not found
     """
     try:
-        conn = sqlite3.connect(DB_PATH)
+        conn = _get_conn()
         cursor = conn.cursor()
         
-        cursor.execute("""
-            SELECT design_data FROM user_designs 
-            WHERE username = ? AND design_name = ?
-        """, (username, design_name))
+        cursor.execute(_SQL_SELECT_DESIGN_DATA, (username, design_name))
         
         result = cursor.fetchone()
         conn.close()
@@ -192,32 +352,17 @@ def get_user_designs(username: str) -> List[Dict]:
         List of design dictionaries with metadata
     """
     try:
-        conn = sqlite3.connect(DB_PATH)
-        conn.row_factory = sqlite3.Row
+        conn = _get_conn()
         cursor = conn.cursor()
         
-        cursor.execute("""
-            SELECT id, design_name, description, created_at, updated_at, 
-                   is_favorite, tags
-            FROM user_designs 
-            WHERE username = ?
-            ORDER BY updated_at DESC
-        """, (username,))
+        cursor.execute(_SQL_LIST_DESIGNS, (username,))
         
         results = cursor.fetchall()
         conn.close()
         
-        designs = []
-        for row in results:
-            designs.append({
-                "id": row["id"],
-                "design_name": row["design_name"],
-                "description": row["description"],
-                "created_at": row["created_at"],
-                "updated_at": row["updated_at"],
-                "is_favorite": bool(row["is_favorite"]),
-                "tags": row["tags"]
-            })
+        designs = [dict(row) for row in results]
+        for design in designs:
+            design["is_favorite"] = bool(design["is_favorite"])
         
         return designs
     
@@ -238,30 +383,19 @@ def delete_design_from_db(username: str, design_name: str) -> bool:
         True if successful, False otherwise
     """
     try:
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        
-        # Get design_id first
-        cursor.execute(
-            "SELECT id FROM user_designs WHERE username = ? AND design_name = ?",
-            (username, design_name)
-        )
-        result = cursor.fetchone()
-        
-        if not result:
-            conn.close()
-            return False
-        
-        design_id = result[0]
-        
-        # Delete design (versions will cascade delete)
-        cursor.execute(
-            "DELETE FROM user_designs WHERE id = ?",
-            (design_id,)
-        )
-        
-        conn.commit()
-        conn.close()
+        with _write_txn() as cursor:
+            # Get design_id first
+            cursor.execute(_SQL_SELECT_DESIGN_ID, (username, design_name))
+            result = cursor.fetchone()
+            
+            if not result:
+                return False
+            
+            design_id = result[0]
+            
+            # Delete design (versions will cascade delete)
+            cursor.execute(_SQL_DELETE_DESIGN, (design_id,))
+            
         return True
     
     except Exception as e:
@@ -281,31 +415,19 @@ def toggle_favorite(username: str, design_name: str) -> bool:
         New favorite status
     """
     try:
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        
-        # Get current status
-        cursor.execute(
-            "SELECT is_favorite FROM user_designs WHERE username = ? AND design_name = ?",
-            (username, design_name)
-        )
-        result = cursor.fetchone()
-        
-        if not result:
-            conn.close()
-            return False
-        
-        new_status = 1 - result[0]  # Toggle 0 -> 1 or 1 -> 0
-        
-        # Update
-        cursor.execute("""
-            UPDATE user_designs 
-            SET is_favorite = ?
-            WHERE username = ? AND design_name = ?
-        """, (new_status, username, design_name))
-        
-        conn.commit()
-        conn.close()
+        with _write_txn() as cursor:
+            # Get current status
+            cursor.execute(_SQL_SELECT_FAVORITE, (username, design_name))
+            result = cursor.fetchone()
+            
+            if not result:
+                return False
+            
+            new_status = 1 - result[0]  # Toggle 0 -> 1 or 1 -> 0
+            
+            # Update
+            cursor.execute(_SQL_UPDATE_FAVORITE, (new_status, username, design_name))
+            
         return bool(new_status)
     
     except Exception as e:
@@ -325,29 +447,17 @@ def get_design_versions(username: str, design_name: str) -> List[Dict]:
         List of design versions
     """
     try:
-        conn = sqlite3.connect(DB_PATH)
-        conn.row_factory = sqlite3.Row
+        conn = _get_conn()
         cursor = conn.cursor()
         
-        cursor.execute("""
-            SELECT v.version_number, v.design_data, v.version_notes, v.created_at
-            FROM design_versions v
-            JOIN user_designs d ON v.design_id = d.id
-            WHERE d.username = ? AND d.design_name = ?
-            ORDER BY v.version_number DESC
-        """, (username, design_name))
+        cursor.execute(_SQL_LIST_VERSIONS, (username, design_name))
         
         results = cursor.fetchall()
         conn.close()
         
-        versions = []
-        for row in results:
-            versions.append({
-                "version_number": row["version_number"],
-                "design_data": json.loads(row["design_data"]),
-                "version_notes": row["version_notes"],
-                "created_at": row["created_at"]
-            })
+        versions = [dict(row) for row in results]
+        for version in versions:
+            version["design_data"] = json.loads(version["design_data"])
         
         return versions
     
@@ -369,54 +479,34 @@ def restore_design_version(username: str, design_name: str, version_number: int)
         True if successful, False otherwise
     """
     try:
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        
-        # Get the version data
-        cursor.execute("""
-            SELECT v.design_data
-            FROM design_versions v
-            JOIN user_designs d ON v.design_id = d.id
-            WHERE d.username = ? AND d.design_name = ? AND v.version_number = ?
-        """, (username, design_name, version_number))
-        
-        result = cursor.fetchone()
-        
-        if not result:
-            conn.close()
-            return False
-        
-        design_data = result[0]
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        
-        # Update the main design
-        cursor.execute("""
-            UPDATE user_designs 
-            SET design_data = ?, updated_at = ?
-            WHERE username = ? AND design_name = ?
-        """, (design_data, timestamp, username, design_name))
-        
-        # Get design_id and create new version
-        cursor.execute(
-            "SELECT id FROM user_designs WHERE username = ? AND design_name = ?",
-            (username, design_name)
-        )
-        design_id = cursor.fetchone()[0]
-        
-        cursor.execute(
-            "SELECT MAX(version_number) FROM design_versions WHERE design_id = ?",
-            (design_id,)
-        )
-        max_version = cursor.fetchone()[0] or 0
-        
-        cursor.execute("""
-            INSERT INTO design_versions 
-            (design_id, version_number, design_data, version_notes)
-            VALUES (?, ?, ?, ?)
-        """, (design_id, max_version + 1, design_data, f"Restored from version {version_number}"))
-        
-        conn.commit()
-        conn.close()
+        with _write_txn() as cursor:
+            # Get the version data
+            cursor.execute(
+                _SQL_SELECT_VERSION_DATA, (username, design_name, version_number)
+            )
+            
+            result = cursor.fetchone()
+            
+            if not result:
+                return False
+            
+            design_data = result[0]
+            
+            # Update the main design
+            cursor.execute(_SQL_RESTORE_DESIGN, (design_data, username, design_name))
+            
+            # Get design_id and create new version
+            cursor.execute(_SQL_SELECT_DESIGN_ID, (username, design_name))
+            design_id = cursor.fetchone()[0]
+            
+            cursor.execute(_SQL_MAX_VERSION, (design_id,))
+            max_version = cursor.fetchone()[0] or 0
+            
+            cursor.execute(
+                _SQL_INSERT_VERSION,
+                (design_id, max_version + 1, design_data, f"Restored from version {version_number}")
+            )
+            
         return True
     
     except Exception as e:
@@ -435,28 +525,19 @@ def get_design_stats(username: str) -> Dict:
         Dictionary with design statistics
     """
     try:
-        conn = sqlite3.connect(DB_PATH)
+        conn = _get_conn()
         cursor = conn.cursor()
         
         # Total designs
-        cursor.execute(
-            "SELECT COUNT(*) FROM user_designs WHERE username = ?",
-            (username,)
-        )
+        cursor.execute(_SQL_COUNT_DESIGNS, (username,))
         total_designs = cursor.fetchone()[0]
         
         # Favorite designs
-        cursor.execute(
-            "SELECT COUNT(*) FROM user_designs WHERE username = ? AND is_favorite = 1",
-            (username,)
-        )
+        cursor.execute(_SQL_COUNT_FAVORITES, (username,))
         favorite_designs = cursor.fetchone()[0]
         
         # Total versions
-        cursor.execute("""
-            SELECT COUNT(*) FROM design_versions 
-            WHERE design_id IN (SELECT id FROM user_designs WHERE username = ?)
-        """, (username,))
+        cursor.execute(_SQL_COUNT_USER_VERSIONS, (username,))
         total_versions = cursor.fetchone()[0]
         
         conn.close()
@@ -518,6 +599,30 @@ def render_design_selector_db(username: str):
                 st.rerun()
 
 
+def _report_pending_saves():
+    """
+    Report background saves that finished since the last rerun.
+    
+    Saves still running after _SAVE_WAIT_SECONDS are kept in session state;
+    each is reported once, as a success or an error, when it completes.
+    """
+    pending = st.session_state.get("pending_design_saves")
+    if not pending:
+        return
+    
+    still_running = []
+    for design_name, future in pending:
+        if not future.done():
+            still_running.append((design_name, future))
+        elif future.exception() is not None:
+            st.error(f"❌ Failed to save {design_name}: {future.exception()}")
+        elif future.result():
+            st.success(f"✅ Saved: {design_name}")
+        else:
+            st.error(f"❌ Failed to save {design_name}")
+    st.session_state.pending_design_saves = still_running
+
+
 def render_save_design_form_db(username: str):
     """
     Render a form to save current design to database.
@@ -525,6 +630,8 @@ def render_save_design_form_db(username: str):
     Args:
         username: Current username
     """
+    _report_pending_saves()
+    
     design_name = st.text_input(
         "Design Name",
         value=st.session_state.get("current_design_name", "My Design"),
@@ -546,7 +653,7 @@ def render_save_design_form_db(username: str):
     
     if st.button("💾 Save to Database", type="primary", use_container_width=True):
         if design_name.strip():
-            success = save_design_to_db(
+            future = save_design_async(
                 username,
                 design_name,
                 st.session_state.design,
@@ -554,6 +661,18 @@ def render_save_design_form_db(username: str):
                 tags
             )
             
+            try:
+                success = future.result(timeout=_SAVE_WAIT_SECONDS)
+            except FutureTimeout:
+                # Still writing - let the UI carry on; the outcome is
+                # reported on a later rerun by _report_pending_saves
+                st.session_state.current_design_name = design_name
+                st.session_state.setdefault("pending_design_saves", []).append(
+                    (design_name, future)
+                )
+                st.toast(f"💾 Saving {design_name} in the background...")
+                return
+            
             if success:
                 st.session_state.current_design_name = design_name
                 st.success(f"✅ Saved: {design_name}")
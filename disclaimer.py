@@ -1,10 +1,8 @@
 # ui/disclaimer.py
 import streamlit as st
 
-def render_disclaimer():
-    st.info("⚠️ Educational & research use only. Not for clinical diagnosis/treatment. Expand for full disclaimer.")
-    with st.expander("⚠️ IMPORTANT DISCLAIMER — click to expand/collapse", expanded=False):
-        st.markdown("""
+# Static disclaimer markup, emitted via st.html so it skips markdown parsing
+_DISCLAIMER_HTML = """
 <div style='background-color:#fff3cd; border-left:5px solid #ffc107; padding:15px; border-radius:5px;'>
   <h4 style='color:#856404; margin-top:0;'>⚠️ IMPORTANT NOTICE</h4>
   <ul style='color:#856404;'>
@@ -20,4 +18,9 @@ def render_disclaimer():
   <p style='margin:2px 0;'>📞 <b>Mobile:</b> 00 971 50 6690381</p>
   <p style='margin:2px 0 0 0;'>📧 <b>Email:</b> info@expertsgroup.me</p>
 </div>
-        """, unsafe_allow_html=True)
+"""
+
+def render_disclaimer():
+    st.info("⚠️ Educational & research use only. Not for clinical diagnosis/treatment. Expand for full disclaimer.")
+    with st.expander("⚠️ IMPORTANT DISCLAIMER — click to expand/collapse", expanded=False):
+        st.html(_DISCLAIMER_HTML)
@@ -4,12 +4,106 @@ Handles exporting designs in multiple formats: JSON, CSV, PDF
 """
 
 import json
-import csv
 import io
 from datetime import datetime
+from functools import lru_cache
+from importlib.util import find_spec
 from pathlib import Path
+from types import SimpleNamespace
+from typing import BinaryIO, Callable
 import streamlit as st
 
+try:
+    import orjson
+    
+    def _dumps(obj) -> str:
+        return orjson.dumps(
+            obj,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        ).decode()
+except ImportError:
+    def _dumps(obj) -> str:
+        return json.dumps(obj, indent=2, default=str)
+
+
+# Upper bound on cached exports per format
+_EXPORT_CACHE_ENTRIES = 32
+
+# Checked without importing reportlab; the PDF is only built on download
+_HAS_REPORTLAB = find_spec("reportlab") is not None
+
+
+# Download filename helpers
+_FILE_EXTENSIONS = {"json": "json", "csv": "csv", "pdf": "pdf"}
+# Whitespace and characters not allowed in filenames on common OSes
+_NAME_TRANS = str.maketrans({c: "_" for c in ' \t/\\:*?"<>|'})
+
+
+# Characters that force a CSV field to be quoted (csv.QUOTE_MINIMAL rules)
+_CSV_SPECIAL = frozenset(',"\r\n')
+
+
+def _csv_field(text: str) -> str:
+    """Quote a CSV field exactly as csv.writer would with QUOTE_MINIMAL."""
+    if _CSV_SPECIAL.isdisjoint(text):
+        return text
+    return '"' + text.replace('"', '""') + '"'
+
+
+# PDF parameter groups, in report order
+_CORE_PARAMS = (
+    "Material", "Size", "Target", "Charge", "PDI", "HydrodynamicSize"
+)
+
+_MATERIAL_PARAMS = (
+    "CrystallinityIndex", "PorosityLevel", "PoreSize", "SurfaceCoating",
+    "CoatingThickness", "FunctionalGroups", "Hydrophobicity", "SurfaceRoughness",
+    "ZetaPotentialStability"
+)
+
+_SURFACE_PARAMS = (
+    "SurfaceArea", "Ligand", "LigandDensity", "Receptor", "ReceptorBinding"
+)
+
+_PAYLOAD_PARAMS = (
+    "Encapsulation", "Stability", "DegradationTime", "ReleaseProfile",
+    "ReleasePredictability"
+)
+
+# (sub-heading, parameters, table style name in _pdf_styles())
+_PDF_SECTIONS = (
+    ("Core Properties", _CORE_PARAMS, "core_table"),
+    ("Material Properties", _MATERIAL_PARAMS, "material_table"),
+    ("Surface Properties", _SURFACE_PARAMS, "surface_table"),
+    ("Payload Properties", _PAYLOAD_PARAMS, "payload_table"),
+)
+
+
+def _format_value(value) -> str:
+    """Render a design value as text; lists become comma-separated."""
+    if isinstance(value, list):
+        return ", ".join(map(str, value))
+    return str(value)
+
+
+def _format_design(design: dict) -> dict:
+    """Format every design value once, for reuse across all export sections."""
+    return {key: _format_value(value) for key, value in design.items()}
+
+
+def _design_key(design: dict) -> tuple:
+    """
+    Snapshot of a design used as an export cache key. Keeps the user's
+    parameter order, since the cached builders export it as-is.
+    """
+    return tuple(design.items())
+
+
+def _now_str() -> str:
+    """Export timestamp as shown in CSV and PDF reports."""
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
 
 def export_design_as_json(design: dict, design_name: str = None) -> str:
     """
@@ -22,16 +116,23 @@ def export_design_as_json(design: dict, design_name: str = None) -> str:
     Returns:
         JSON string of the design
     """
-    export_data = {
-        "metadata": {
-            "exported_at": datetime.now().isoformat(),
-            "app_version": "1.0.0",
-            "design_name": design_name or "Untitled Design"
-        },
-        "design": design
-    }
-    
-    return json.dumps(export_data, indent=2)
+    # The timestamped metadata is serialized per call; only the design body
+    # is cached. Both are nested one level, hence the extra indentation.
+    metadata = _dumps({
+        "exported_at": datetime.now().isoformat(),
+        "app_version": "1.0.0",
+        "design_name": design_name or "Untitled Design"
+    })
+    return (
+        '{\n  "metadata": ' + metadata.replace("\n", "\n  ")
+        + ',\n  "design": ' + _build_json(_design_key(design)) + "\n}"
+    )
+
+
+@st.cache_data(max_entries=_EXPORT_CACHE_ENTRIES, show_spinner=False)
+def _build_json(design_items: tuple) -> str:
+    """The "design" object of a JSON export, indented for its nesting level."""
+    return _dumps(dict(design_items)).replace("\n", "\n  ")
 
 
 def export_design_as_csv(design: dict, design_name: str = None) -> str:
@@ -45,25 +146,28 @@ def export_design_as_csv(design: dict, design_name: str = None) -> str:
     Returns:
         CSV string of the design
     """
-    output = io.StringIO()
-    writer = csv.writer(output)
-    
-    # Header
-    writer.writerow(["Design Export - " + (design_name or "Untitled Design")])
-    writer.writerow(["Exported", datetime.now().strftime("%Y-%m-%d %H:%M:%S")])
-    writer.writerow([])
-    
-    # Design parameters
-    writer.writerow(["Parameter", "Value"])
-    for key, value in design.items():
-        # Handle list values (like FunctionalGroups, SurfaceCoating)
-        if isinstance(value, list):
-            value_str = ", ".join(str(v) for v in value)
-        else:
-            value_str = str(value)
-        writer.writerow([key, value_str])
+    # Header (timestamped, so built per call)
+    header = "\r\n".join((
+        _csv_field("Design Export - " + (design_name or "Untitled Design")),
+        "Exported," + _now_str(),
+        "",
+        "Parameter,Value",
+    ))
+    return header + "\r\n" + _build_csv(_design_key(design))
+
+
+@st.cache_data(max_entries=_EXPORT_CACHE_ENTRIES, show_spinner=False)
+def _build_csv(design_items: tuple) -> str:
+    """The parameter rows of a CSV export."""
+    # Design parameters (lists like FunctionalGroups become comma-separated)
+    rows = [
+        _csv_field(str(key)) + "," + _csv_field(value_str)
+        for key, value_str in _format_design(dict(design_items)).items()
+    ]
     
-    return output.getvalue()
+    # csv.writer terminates every row, including the last, with \r\n
+    rows.append("")
+    return "\r\n".join(rows)
 
 
 def create_pdf_report(design: dict, design_name: str = None, include_recommendations: bool = True) -> bytes:
@@ -79,147 +183,175 @@ def create_pdf_report(design: dict, design_name: str = None, include_recommendat
     Returns:
         PDF bytes
     """
+    # Not cached: every report carries its own export date, and reportlab
+    # consumes the flowables while building, so no part can be reused
+    pdf_buffer = io.BytesIO()
+    write_pdf_report(pdf_buffer, design, design_name, include_recommendations)
+    return pdf_buffer.getvalue()
+
+
+@lru_cache(maxsize=1)
+def _ensure_reportlab() -> SimpleNamespace:
+    """
+    Import the reportlab names used for reports once per process.
+    Raises ImportError (uncached) if reportlab is missing.
+    """
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate, Table, Paragraph, Spacer
+    
+    return SimpleNamespace(
+        letter=letter,
+        inch=inch,
+        SimpleDocTemplate=SimpleDocTemplate,
+        Table=Table,
+        Paragraph=Paragraph,
+        Spacer=Spacer,
+    )
+
+
+@lru_cache(maxsize=1)
+def _pdf_styles() -> SimpleNamespace:
+    """
+    Build the reportlab paragraph and table styles once.
+    
+    Styles are immutable once built, so every report shares the same
+    instances instead of re-parsing hex colours and style commands per call.
+    Raises ImportError (uncached) if reportlab is missing.
+    """
+    from reportlab.lib import colors
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.platypus import TableStyle
+    
+    blue = colors.HexColor('#1976d2')
+    navy = colors.HexColor('#004E89')
+    green = colors.HexColor('#28a745')
+    stripe = [colors.white, colors.HexColor('#f9f9f9')]
+    
+    styles = getSampleStyleSheet()
+    
+    def header_table_style(header_bg, *extra):
+        return TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), header_bg),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 10),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+            *extra,
+            ('GRID', (0, 0), (-1, -1), 1, colors.black),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), stripe)
+        ])
+    
+    return SimpleNamespace(
+        normal=styles['Normal'],
+        title=ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=24,
+            textColor=blue,
+            spaceAfter=30,
+            alignment=1  # Center
+        ),
+        heading=ParagraphStyle(
+            'CustomHeading',
+            parent=styles['Heading2'],
+            fontSize=14,
+            textColor=navy,
+            spaceAfter=12,
+            spaceBefore=12
+        ),
+        sub_heading=ParagraphStyle(
+            'SubHeading', parent=styles['Heading3'], fontSize=11,
+            textColor=colors.HexColor('#333')
+        ),
+        bullet_list=ParagraphStyle(
+            'BulletList', parent=styles['Normal'], leading=15, spaceAfter=3
+        ),
+        metadata_table=TableStyle([
+            ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#f0f0f0')),
+            ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 10),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+            ('GRID', (0, 0), (-1, -1), 1, colors.grey)
+        ]),
+        core_table=header_table_style(
+            blue, ('BACKGROUND', (0, 1), (-1, -1), colors.beige)
+        ),
+        material_table=header_table_style(navy),
+        surface_table=header_table_style(colors.HexColor('#00897b')),
+        payload_table=header_table_style(colors.HexColor('#6a1b9a')),
+        impact_table=header_table_style(green),
+    )
+
+
+def write_pdf_report(out_file: BinaryIO, design: dict, design_name: str = None,
+                     include_recommendations: bool = True) -> None:
+    """
+    Write a PDF report of the design straight into a binary file-like object.
+    Requires reportlab: pip install reportlab
+    
+    Args:
+        out_file: Writable binary stream (file, BytesIO, HTTP response, ...)
+        design: Design dictionary
+        design_name: Name of the design
+        include_recommendations: Whether to include recommendations
+    """
     try:
-        from reportlab.lib.pagesizes import letter, A4
-        from reportlab.lib import colors
-        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-        from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
-        from reportlab.lib.units import inch
+        rl = _ensure_reportlab()
         from core.scoring import compute_impact, get_recommendations
+        pdf_styles = _pdf_styles()
     except ImportError:
         raise ImportError(
             "reportlab is required for PDF export. Install with: pip install reportlab"
         )
     
-    # Create PDF in memory
-    pdf_buffer = io.BytesIO()
-    doc = SimpleDocTemplate(pdf_buffer, pagesize=letter, topMargin=0.5*inch, bottomMargin=0.5*inch)
+    Table, Paragraph, Spacer, inch = rl.Table, rl.Paragraph, rl.Spacer, rl.inch
     
-    # Styles
-    styles = getSampleStyleSheet()
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=24,
-        textColor=colors.HexColor('#1976d2'),
-        spaceAfter=30,
-        alignment=1  # Center
-    )
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading2'],
-        fontSize=14,
-        textColor=colors.HexColor('#004E89'),
-        spaceAfter=12,
-        spaceBefore=12
-    )
+    # Write PDF directly to the caller's stream
+    doc = rl.SimpleDocTemplate(out_file, pagesize=rl.letter, topMargin=0.5*inch, bottomMargin=0.5*inch)
     
     # Build story
     story = []
     
     # Title
-    story.append(Paragraph(design_name or "Nanoparticle Design Report", title_style))
+    story.append(Paragraph(design_name or "Nanoparticle Design Report", pdf_styles.title))
     story.append(Spacer(1, 0.2*inch))
     
     # Metadata
     metadata_data = [
-        ["Export Date", datetime.now().strftime("%Y-%m-%d %H:%M:%S")],
+        ["Export Date", _now_str()],
         ["Design Name", design_name or "Untitled Design"],
         ["App", "NanoBio Studio v1.0"]
     ]
-    metadata_table = Table(metadata_data, colWidths=[2*inch, 4*inch])
-    metadata_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#f0f0f0')),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 1, colors.grey)
-    ]))
+    metadata_table = Table(metadata_data, colWidths=[2*inch, 4*inch],
+                           style=pdf_styles.metadata_table)
     story.append(metadata_table)
     story.append(Spacer(1, 0.3*inch))
     
     # Design Parameters Section
-    story.append(Paragraph("Design Parameters", heading_style))
-    
-    # Organize parameters by category
-    core_params = [
-        "Material", "Size", "Target", "Charge", "PDI", "HydrodynamicSize"
-    ]
-    
-    material_params = [
-        "CrystallinityIndex", "PorosityLevel", "PoreSize", "SurfaceCoating",
-        "CoatingThickness", "FunctionalGroups", "Hydrophobicity", "SurfaceRoughness",
-        "ZetaPotentialStability"
-    ]
-    
-    surface_params = [
-        "SurfaceArea", "Ligand", "LigandDensity", "Receptor", "ReceptorBinding"
-    ]
-    
-    payload_params = [
-        "Encapsulation", "Stability", "DegradationTime", "ReleaseProfile",
-        "ReleasePredictability"
-    ]
-    
-    # Core Properties
-    story.append(Paragraph("Core Properties", ParagraphStyle(
-        'SubHeading', parent=styles['Heading3'], fontSize=11, textColor=colors.HexColor('#333')))
-    )
-    core_data = [["Parameter", "Value"]]
-    for param in core_params:
-        if param in design:
-            value = design[param]
-            if isinstance(value, list):
-                value = ", ".join(str(v) for v in value)
-            core_data.append([param, str(value)])
-    
-    core_table = Table(core_data, colWidths=[2.5*inch, 3.5*inch])
-    core_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1976d2')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f9f9f9')])
-    ]))
-    story.append(core_table)
-    story.append(Spacer(1, 0.2*inch))
-    
-    # Material Properties
-    story.append(Paragraph("Material Properties", ParagraphStyle(
-        'SubHeading', parent=styles['Heading3'], fontSize=11, textColor=colors.HexColor('#333')))
-    )
-    material_data = [["Parameter", "Value"]]
-    for param in material_params:
-        if param in design:
-            value = design[param]
-            if isinstance(value, list):
-                value = ", ".join(str(v) for v in value)
-            material_data.append([param, str(value)])
-    
-    material_table = Table(material_data, colWidths=[2.5*inch, 3.5*inch])
-    material_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#004E89')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f9f9f9')])
-    ]))
-    story.append(material_table)
-    story.append(Spacer(1, 0.2*inch))
+    story.append(Paragraph("Design Parameters", pdf_styles.heading))
+    
+    # One sub-heading + parameter table per category; empty categories are skipped
+    formatted = _format_design(design)
+    col_widths = [2.5*inch, 3.5*inch]
+    for title, params, style_name in _PDF_SECTIONS:
+        rows = [(param, formatted[param]) for param in params if param in formatted]
+        if not rows:
+            continue
+        story.extend((
+            Paragraph(title, pdf_styles.sub_heading),
+            Table([("Parameter", "Value"), *rows], colWidths=col_widths,
+                  style=getattr(pdf_styles, style_name)),
+            Spacer(1, 0.2*inch),
+        ))
     
     # Impact Metrics
     try:
         impact = compute_impact(design)
-        story.append(Paragraph("Impact Metrics", heading_style))
+        story.append(Paragraph("Impact Metrics", pdf_styles.heading))
         
         impact_data = [
             ["Metric", "Value"],
@@ -228,17 +360,8 @@ def create_pdf_report(design: dict, design_name: str = None, include_recommendat
             ["Manufacturing Cost", f"${impact.get('Cost', 0):.1f}"],
         ]
         
-        impact_table = Table(impact_data, colWidths=[2.5*inch, 3.5*inch])
-        impact_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#28a745')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f9f9f9')])
-        ]))
+        impact_table = Table(impact_data, colWidths=col_widths,
+                             style=pdf_styles.impact_table)
         story.append(impact_table)
         story.append(Spacer(1, 0.2*inch))
     except:
@@ -249,10 +372,12 @@ def create_pdf_report(design: dict, design_name: str = None, include_recommendat
         try:
             recommendations = get_recommendations(design)
             if recommendations:
-                story.append(Paragraph("Recommendations", heading_style))
-                for rec in recommendations:
-                    story.append(Paragraph(f"• {rec}", styles['Normal']))
-                    story.append(Spacer(1, 0.05*inch))
+                story.append(Paragraph("Recommendations", pdf_styles.heading))
+                # One flowable for the whole list; line breaks separate bullets
+                story.append(Paragraph(
+                    "<br/>".join(f"• {rec}" for rec in recommendations),
+                    pdf_styles.bullet_list
+                ))
                 story.append(Spacer(1, 0.1*inch))
         except:
             pass
@@ -262,13 +387,11 @@ def create_pdf_report(design: dict, design_name: str = None, include_recommendat
     story.append(Paragraph(
         "<font size=8><i>This design report was generated by NanoBio Studio. "
         "Please validate all designs experimentally before use.</i></font>",
-        styles['Normal']
+        pdf_styles.normal
     ))
     
     # Build PDF
     doc.build(story)
-    pdf_buffer.seek(0)
-    return pdf_buffer.getvalue()
 
 
 def get_download_filename(design_name: str = None, format_type: str = "json") -> str:
@@ -282,18 +405,50 @@ def get_download_filename(design_name: str = None, format_type: str = "json") ->
     Returns:
         Filename with timestamp
     """
-    name = design_name or "design"
-    name = name.replace(" ", "_").lower()
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    extensions = {"json": "json", "csv": "csv", "pdf": "pdf"}
-    ext = extensions.get(format_type, format_type)
-    return f"{name}_{timestamp}.{ext}"
+    name = (design_name or "design").translate(_NAME_TRANS).lower()
+    ext = _FILE_EXTENSIONS.get(format_type, format_type)
+    return f"{name}_{datetime.now():%Y%m%d_%H%M%S}.{ext}"
+
+
+def _deferred_pdf(design: dict, design_name: str = None) -> Callable[[], bytes]:
+    """
+    Zero-argument PDF builder for st.download_button(data=...).
+    
+    Streamlit runs it on the download thread, where st.* calls are ignored,
+    so a failure is recorded in session state (and re-raised to fail the
+    download); _show_pdf_error reports it on the next rerun.
+    """
+    design = dict(design)
+    errors = st.session_state.setdefault("export_errors", {})
+    
+    def build() -> bytes:
+        try:
+            return create_pdf_report(design, design_name)
+        except Exception as e:
+            errors["pdf"] = e
+            raise
+    
+    return build
+
+
+def _show_pdf_error(message: str) -> None:
+    """Show (once) the error of the last failed deferred PDF build, if any."""
+    error = st.session_state.get("export_errors", {}).pop("pdf", None)
+    if error is None:
+        return
+    if isinstance(error, ImportError):
+        st.warning("📦 PDF export requires: `pip install reportlab`")
+    else:
+        st.error(f"{message}: {str(error)}")
 
 
 def render_export_controls(design: dict, design_name: str = "My Design"):
     """
     Render export UI controls in the app.
     
+    JSON and CSV are built up front (cached per design); the PDF is only
+    generated when its download button is clicked.
+    
     Args:
         design: The design dictionary to export
         design_name: Name of the design
@@ -303,51 +458,41 @@ def render_export_controls(design: dict, design_name: str = "My Design"):
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        if st.button("📄 Export as JSON", use_container_width=True):
-            try:
-                json_data = export_design_as_json(design, design_name)
-                st.download_button(
-                    label="Download JSON",
-                    data=json_data,
-                    file_name=get_download_filename(design_name, "json"),
-                    mime="application/json",
-                    use_container_width=True
-                )
-                st.success("JSON ready for download!")
-            except Exception as e:
-                st.error(f"Error exporting JSON: {str(e)}")
+        try:
+            st.download_button(
+                label="📄 Export as JSON",
+                data=export_design_as_json(design, design_name),
+                file_name=get_download_filename(design_name, "json"),
+                mime="application/json",
+                use_container_width=True
+            )
+        except Exception as e:
+            st.error(f"Error exporting JSON: {str(e)}")
     
     with col2:
-        if st.button("📊 Export as CSV", use_container_width=True):
-            try:
-                csv_data = export_design_as_csv(design, design_name)
-                st.download_button(
-                    label="Download CSV",
-                    data=csv_data,
-                    file_name=get_download_filename(design_name, "csv"),
-                    mime="text/csv",
-                    use_container_width=True
-                )
-                st.success("CSV ready for download!")
-            except Exception as e:
-                st.error(f"Error exporting CSV: {str(e)}")
+        try:
+            st.download_button(
+                label="📊 Export as CSV",
+                data=export_design_as_csv(design, design_name),
+                file_name=get_download_filename(design_name, "csv"),
+                mime="text/csv",
+                use_container_width=True
+            )
+        except Exception as e:
+            st.error(f"Error exporting CSV: {str(e)}")
     
     with col3:
-        if st.button("📑 Export as PDF", use_container_width=True):
-            try:
-                pdf_data = create_pdf_report(design, design_name)
-                st.download_button(
-                    label="Download PDF",
-                    data=pdf_data,
-                    file_name=get_download_filename(design_name, "pdf"),
-                    mime="application/pdf",
-                    use_container_width=True
-                )
-                st.success("PDF ready for download!")
-            except ImportError:
-                st.warning("📦 PDF export requires: `pip install reportlab`")
-            except Exception as e:
-                st.error(f"Error exporting PDF: {str(e)}")
+        if _HAS_REPORTLAB:
+            _show_pdf_error("Error exporting PDF")
+            st.download_button(
+                label="📑 Export as PDF",
+                data=_deferred_pdf(design, design_name),
+                file_name=get_download_filename(design_name, "pdf"),
+                mime="application/pdf",
+                use_container_width=True
+            )
+        else:
+            st.warning("📦 PDF export requires: `pip install reportlab`")
 
 
 def render_quick_export(design: dict, design_name: str = "design"):
@@ -366,27 +511,30 @@ def render_quick_export(design: dict, design_name: str = "design"):
         label_visibility="collapsed"
     )
     
-    if st.button("Export", use_container_width=True):
-        try:
-            if export_format == "JSON":
-                data = export_design_as_json(design, design_name)
-                filename = get_download_filename(design_name, "json")
-                mime = "application/json"
-            elif export_format == "CSV":
-                data = export_design_as_csv(design, design_name)
-                filename = get_download_filename(design_name, "csv")
-                mime = "text/csv"
-            else:  # PDF
-                data = create_pdf_report(design, design_name)
-                filename = get_download_filename(design_name, "pdf")
-                mime = "application/pdf"
-            
-            st.download_button(
-                label=f"Download {export_format}",
-                data=data,
-                file_name=filename,
-                mime=mime,
-                use_container_width=True
-            )
-        except Exception as e:
-            st.error(f"Export failed: {str(e)}")
+    try:
+        if export_format == "JSON":
+            data = export_design_as_json(design, design_name)
+            filename = get_download_filename(design_name, "json")
+            mime = "application/json"
+        elif export_format == "CSV":
+            data = export_design_as_csv(design, design_name)
+            filename = get_download_filename(design_name, "csv")
+            mime = "text/csv"
+        else:  # PDF, built on click
+            if not _HAS_REPORTLAB:
+                st.warning("📦 PDF export requires: `pip install reportlab`")
+                return
+            _show_pdf_error("Export failed")
+            data = _deferred_pdf(design, design_name)
+            filename = get_download_filename(design_name, "pdf")
+            mime = "application/pdf"
+        
+        st.download_button(
+            label=f"Download {export_format}",
+            data=data,
+            file_name=filename,
+            mime=mime,
+            use_container_width=True
+        )
+    except Exception as e:
+        st.error(f"Export failed: {str(e)}")
@@ -0,0 +1,58 @@
+# migrate_msgpack.py
+# One-shot conversion of the large JSON columns in nanobio_studio.db to
+# msgpack (see USE_MSGPACK in models.py). Run with --rollback to go back to
+# JSON text before turning the flag off again.
+import json
+import sqlite3
+import sys
+
+try:
+    import msgpack
+except ImportError:
+    raise ImportError(
+        "migrate_msgpack.py requires msgpack. Install with: pip install msgpack"
+    )
+
+DB_PATH = "nanobio_studio.db"
+
+# table -> (primary key, packed columns)
+PACKED_COLUMNS = {
+    "designs": ("id", ["parameters"]),
+    "optimizations": ("id", ["pareto_front", "best_design", "optimization_history"]),
+    "simulations": ("id", ["results"]),
+}
+
+
+def to_msgpack(value):
+    if isinstance(value, str):
+        return msgpack.packb(json.loads(value), use_bin_type=True)
+    return value  # already packed (or NULL)
+
+
+def to_json(value):
+    if isinstance(value, bytes):
+        return json.dumps(msgpack.unpackb(value, raw=False))
+    return value  # already JSON text (or NULL)
+
+
+def migrate(conn, convert):
+    converted = 0
+    for table, (pk, columns) in PACKED_COLUMNS.items():
+        rows = conn.execute(f"SELECT {pk}, {', '.join(columns)} FROM {table}").fetchall()
+        updates = [
+            tuple(convert(value) for value in row[1:]) + (row[0],)
+            for row in rows
+        ]
+        assignments = ", ".join(f"{col} = ?" for col in columns)
+        conn.executemany(f"UPDATE {table} SET {assignments} WHERE {pk} = ?", updates)
+        converted += len(updates)
+    return converted
+
+
+if __name__ == "__main__":
+    rollback = "--rollback" in sys.argv[1:]
+    conn = sqlite3.connect(DB_PATH)
+    with conn:
+        count = migrate(conn, to_json if rollback else to_msgpack)
+    conn.close()
+    print(f"Converted {count} rows to {'JSON' if rollback else 'msgpack'}")
@@ -3,19 +3,97 @@
 # Using SQLAlchemy for ORM-based persistence
 # ============================================================
 
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, ForeignKey, Text, JSON
+from sqlalchemy import create_engine, event, insert, update, Column, Index, Integer, String, Float, DateTime, ForeignKey, Text, JSON, LargeBinary
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, relationship
+from sqlalchemy.orm import sessionmaker, relationship, selectinload
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.types import TypeDecorator
 from datetime import datetime
+from functools import lru_cache
 import json
+import os
 from pathlib import Path
 
+# Store large result blobs as msgpack instead of JSON text. Off by default;
+# run migrate_msgpack.py after enabling so existing rows are converted too.
+USE_MSGPACK = os.environ.get("NANOBIO_MSGPACK_BLOBS", "0") == "1"
+
+if USE_MSGPACK:
+    try:
+        import msgpack
+    except ImportError:
+        raise ImportError(
+            "NANOBIO_MSGPACK_BLOBS=1 requires msgpack. Install with: pip install msgpack"
+        )
+
 # Database setup
 DB_URL = "sqlite:///nanobio_studio.db"
-engine = create_engine(DB_URL, connect_args={"check_same_thread": False})
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+engine = create_engine(
+    DB_URL,
+    connect_args={"check_same_thread": False, "timeout": 30},
+    poolclass=QueuePool,
+    pool_size=10,
+    max_overflow=20,
+    pool_pre_ping=True,
+)
+
+# Bump whenever tables or indexes change; stored in PRAGMA user_version
+SCHEMA_VERSION = 1
+
+# Applied to every new pooled connection: WAL lets readers run alongside the
+# writer, NORMAL sync drops the per-commit fsync, and the cache/mmap settings
+# keep hot pages in memory (64 MB page cache, 256 MB mmap)
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Tune each SQLite connection as the pool opens it"""
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+# Keep attribute state after commit so repository methods can return objects
+# without a follow-up SELECT and callers can still read them after close
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 Base = declarative_base()
 
+
+class PackedJSON(TypeDecorator):
+    """
+    JSON-compatible column that is stored as msgpack bytes when USE_MSGPACK
+    is set, and as the plain JSON type otherwise.
+    
+    Rows still holding JSON text (written before the switch) are decoded
+    with json, so the flag can be flipped before the migration has run.
+    """
+    impl = LargeBinary
+    cache_ok = True
+    
+    def load_dialect_impl(self, dialect):
+        if USE_MSGPACK:
+            return dialect.type_descriptor(LargeBinary())
+        return dialect.type_descriptor(JSON())
+    
+    def process_bind_param(self, value, dialect):
+        if not USE_MSGPACK or value is None:
+            return value
+        return msgpack.packb(value, use_bin_type=True)
+    
+    def process_result_value(self, value, dialect):
+        if not USE_MSGPACK or value is None:
+            return value
+        if isinstance(value, str):
+            return json.loads(value)
+        return msgpack.unpackb(value, raw=False)
+
 # ============================================================
 # Database Models
 # ============================================================
@@ -39,6 +117,10 @@ class User(Base):
 class Project(Base):
     """Project model for grouping designs"""
     __tablename__ = "projects"
+    __table_args__ = (
+        # list_user_projects: filter by user, newest first
+        Index("ix_projects_user_created", "user_id", "created_at"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -55,6 +137,10 @@ class Project(Base):
 class Design(Base):
     """Design model for storing nanoparticle designs"""
     __tablename__ = "designs"
+    __table_args__ = (
+        # list_user_designs: filter by user (+ project), newest first
+        Index("ix_designs_user_project_created", "user_id", "project_id", "created_at"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -62,8 +148,8 @@ class Design(Base):
     name = Column(String, index=True)
     description = Column(Text, nullable=True)
     
-    # Design parameters stored as JSON
-    parameters = Column(JSON, nullable=False)
+    # Design parameters stored as JSON (msgpack when USE_MSGPACK)
+    parameters = Column(PackedJSON, nullable=False)
     
     # Design metrics (denormalized for quick access)
     delivery_score = Column(Float, nullable=True)
@@ -87,6 +173,10 @@ class Design(Base):
 class Optimization(Base):
     """Optimization run model for tracking optimization history"""
     __tablename__ = "optimizations"
+    __table_args__ = (
+        # list_design_optimizations: filter by design, newest first
+        Index("ix_opt_design_created", "design_id", "created_at"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     design_id = Column(Integer, ForeignKey("designs.id"), nullable=False)
@@ -96,9 +186,9 @@ class Optimization(Base):
     algorithm = Column(String, default="optuna")  # optuna, genetic, grid_search, etc.
     
     # Results
-    pareto_front = Column(JSON, nullable=True)  # List of optimal designs
-    best_design = Column(JSON, nullable=True)
-    optimization_history = Column(JSON, nullable=True)  # Convergence info
+    pareto_front = Column(PackedJSON, nullable=True)  # List of optimal designs
+    best_design = Column(PackedJSON, nullable=True)
+    optimization_history = Column(PackedJSON, nullable=True)  # Convergence info
     
     # Metadata
     status = Column(String, default="pending")  # pending, running, completed, failed
@@ -122,7 +212,7 @@ class Simulation(Base):
     parameters = Column(JSON, nullable=False)
     
     # Results
-    results = Column(JSON, nullable=False)
+    results = Column(PackedJSON, nullable=False)
     execution_time = Column(Float, nullable=True)
     status = Column(String, default="completed")  # pending, running, completed, failed
     
@@ -137,9 +227,19 @@ class Simulation(Base):
 # Initialize Database
 # ============================================================
 
+@lru_cache(maxsize=1)
 def init_db():
-    """Create all tables"""
-    Base.metadata.create_all(bind=engine)
+    """Create all tables (once per process; a no-op on an up-to-date database)"""
+    with engine.begin() as conn:
+        if conn.exec_driver_sql("PRAGMA user_version").scalar() >= SCHEMA_VERSION:
+            return
+        Base.metadata.create_all(bind=conn)
+        # create_all skips tables that already exist, so add any indexes
+        # introduced since an existing database was created
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(bind=conn, checkfirst=True)
+        conn.exec_driver_sql(f"PRAGMA user_version = {SCHEMA_VERSION}")
 
 
 def get_db():
@@ -173,16 +273,27 @@ class DesignRepository:
         )
         self.db.add(design)
         self.db.commit()
-        self.db.refresh(design)
         return design
     
     def get_design(self, design_id: int) -> Design:
         """Get a design by ID"""
         return self.db.query(Design).filter(Design.id == design_id).first()
     
-    def list_user_designs(self, user_id: int, project_id: int = None) -> list:
-        """List all designs for a user, optionally filtered by project"""
-        query = self.db.query(Design).filter(Design.user_id == user_id)
+    def list_user_designs(self, user_id: int, project_id: int = None, load_opts=None) -> list:
+        """
+        List all designs for a user, optionally filtered by project.
+        
+        creator, project and optimizations are batch-loaded (one extra query
+        each) so callers can use them after the session closes; pass
+        load_opts to override.
+        """
+        if load_opts is None:
+            load_opts = (
+                selectinload(Design.creator),
+                selectinload(Design.project),
+                selectinload(Design.optimizations),
+            )
+        query = self.db.query(Design).options(*load_opts).filter(Design.user_id == user_id)
         if project_id:
             query = query.filter(Design.project_id == project_id)
         return query.order_by(Design.created_at.desc()).all()
@@ -196,9 +307,13 @@ class DesignRepository:
                     setattr(design, key, value)
             design.updated_at = datetime.utcnow()
             self.db.commit()
-            self.db.refresh(design)
         return design
     
+    @staticmethod
+    def overall_score(delivery: float, toxicity: float, cost: float) -> float:
+        """Simple overall score (can be weighted)"""
+        return (delivery * 0.4 + (10 - toxicity) * 0.3 + (100 - cost) * 0.3) / 100
+    
     def update_design_scores(self, design_id: int, delivery: float, 
                             toxicity: float, cost: float) -> Design:
         """Update design scores and calculate overall score"""
@@ -207,13 +322,36 @@ class DesignRepository:
             design.delivery_score = delivery
             design.toxicity_score = toxicity
             design.cost_score = cost
-            # Simple overall score (can be weighted)
-            design.overall_score = (delivery * 0.4 + (10 - toxicity) * 0.3 + (100 - cost) * 0.3) / 100
+            design.overall_score = self.overall_score(delivery, toxicity, cost)
             design.updated_at = datetime.utcnow()
             self.db.commit()
-            self.db.refresh(design)
         return design
     
+    def bulk_update_design_scores(self, rows: list) -> int:
+        """
+        Update scores for many designs in one statement and one commit.
+        
+        rows: iterable of (design_id, delivery, toxicity, cost) tuples
+        Returns the number of rows submitted.
+        """
+        now = datetime.utcnow()
+        params = [
+            {
+                "id": design_id,
+                "delivery_score": delivery,
+                "toxicity_score": toxicity,
+                "cost_score": cost,
+                "overall_score": self.overall_score(delivery, toxicity, cost),
+                "updated_at": now,
+            }
+            for design_id, delivery, toxicity, cost in rows
+        ]
+        if params:
+            # ORM bulk UPDATE by primary key (executemany)
+            self.db.execute(update(Design), params)
+            self.db.commit()
+        return len(params)
+    
     def delete_design(self, design_id: int) -> bool:
         """Delete a design"""
         design = self.get_design(design_id)
@@ -243,12 +381,19 @@ class ProjectRepository:
         )
         self.db.add(project)
         self.db.commit()
-        self.db.refresh(project)
         return project
     
-    def list_user_projects(self, user_id: int) -> list:
-        """List all projects for a user"""
-        return self.db.query(Project).filter(Project.user_id == user_id).order_by(Project.created_at.desc()).all()
+    def list_user_projects(self, user_id: int, load_opts=None) -> list:
+        """List all projects for a user, with owner and designs batch-loaded"""
+        if load_opts is None:
+            load_opts = (selectinload(Project.owner), selectinload(Project.designs))
+        return (
+            self.db.query(Project)
+            .options(*load_opts)
+            .filter(Project.user_id == user_id)
+            .order_by(Project.created_at.desc())
+            .all()
+        )
     
     def get_project(self, project_id: int) -> Project:
         """Get a project by ID"""
@@ -263,7 +408,6 @@ class ProjectRepository:
                     setattr(project, key, value)
             project.updated_at = datetime.utcnow()
             self.db.commit()
-            self.db.refresh(project)
         return project
     
     def delete_project(self, project_id: int) -> bool:
@@ -293,7 +437,6 @@ class OptimizationRepository:
         )
         self.db.add(opt)
         self.db.commit()
-        self.db.refresh(opt)
         return opt
     
     def get_optimization(self, optimization_id: int) -> Optimization:
@@ -308,7 +451,6 @@ class OptimizationRepository:
                 if hasattr(opt, key):
                     setattr(opt, key, value)
             self.db.commit()
-            self.db.refresh(opt)
         return opt
     
     def list_design_optimizations(self, design_id: int) -> list:
@@ -318,5 +460,36 @@ class OptimizationRepository:
         ).order_by(Optimization.created_at.desc()).all()
 
 
-# Initialize database on import
-init_db()
+class SimulationRepository:
+    """Repository for simulation database operations"""
+    
+    def __init__(self, db_session):
+        self.db = db_session
+    
+    def bulk_create(self, rows: list) -> int:
+        """
+        Insert many simulation results in one statement and one commit.
+        
+        rows: list of dicts with Simulation column names as keys
+        (design_id, simulation_type, parameters, results, ...).
+        Returns the number of rows inserted.
+        
+        This is an ORM bulk INSERT: no Simulation objects are created and
+        no per-object session events fire (Simulation defines none).
+        """
+        if not rows:
+            return 0
+        now = datetime.utcnow()
+        params = [
+            {"status": "completed", "created_at": now, **row}
+            for row in rows
+        ]
+        self.db.execute(insert(Simulation), params)
+        self.db.commit()
+        return len(params)
+    
+    def list_design_simulations(self, design_id: int) -> list:
+        """List all simulations for a design"""
+        return self.db.query(Simulation).filter(
+            Simulation.design_id == design_id
+        ).order_by(Simulation.created_at.desc()).all()
@@ -81,15 +81,22 @@ from nanobio_studio.ai_engine.pareto import (
 # ============================================================
 from nanobio_studio.ai_engine.objectives import (
     efficacy_proxy,
+    efficacy_scores,
+    batch_score,
     scalarized_score,
 )
 
 from nanobio_studio.ai_engine.toxicity import (
     toxicity_score_hybrid,
+    toxicity_drivers,
+    toxicity_score_batch,
+    toxicity_scores,
 )
 
 from nanobio_studio.ai_engine.cost import (
     cost_score_proxy,
+    cost_score_batch,
+    cost_scores,
 )
 
 from nanobio_studio.ai_engine.uncertainty import (
@@ -122,6 +129,7 @@ from nanobio_studio.ai_engine.explainability import (
 # ============================================================
 from nanobio_studio.ai_engine.reporting import (
     candidates_to_df,
+    candidate_columns,
 )
 
 from nanobio_studio.ai_engine.audit import (
@@ -129,7 +137,9 @@ from nanobio_studio.ai_engine.audit import (
     build_audit_record,
     record_outcome,
     audit_to_json,
+    audit_to_cbor,
     audit_to_html,
+    audit_to_html_stream,
 )
 
 # ============================================================
@@ -171,9 +181,16 @@ __all__ = [
     
     # Scoring
     "efficacy_proxy",
+    "efficacy_scores",
+    "batch_score",
     "scalarized_score",
     "toxicity_score_hybrid",
+    "toxicity_drivers",
+    "toxicity_score_batch",
+    "toxicity_scores",
     "cost_score_proxy",
+    "cost_score_batch",
+    "cost_scores",
     "simple_confidence_from_rules",
     "seed_everything",
     
@@ -191,13 +208,16 @@ __all__ = [
     
     # Reporting
     "candidates_to_df",
+    "candidate_columns",
     
     # Audit
     "AuditRecord",
     "build_audit_record",
     "record_outcome",
     "audit_to_json",
+    "audit_to_cbor",
     "audit_to_html",
+    "audit_to_html_stream",
     
     # Simulation
     "SimulateFn",
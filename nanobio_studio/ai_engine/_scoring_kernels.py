@@ -0,0 +1,54 @@
+"""
+Numeric cores of the Phase-1 scoring functions (efficacy, toxicity, cost).
+
+They take and return plain floats so they can be compiled with Numba: set
+NANOBIO_NUMBA=1 (and install numba) to JIT them at import. Without numba, or
+with the flag off, they run as ordinary Python with identical results.
+String lookups (material priors, cost tables) and driver text stay in the
+Python wrappers that call these kernels.
+"""
+import os
+
+USE_NUMBA = os.environ.get("NANOBIO_NUMBA", "0") == "1"
+
+if USE_NUMBA:
+    try:
+        from numba import njit
+    except ImportError:
+        raise ImportError("NANOBIO_NUMBA=1 requires numba. Install with: pip install numba")
+else:
+    def njit(*args, **kwargs):
+        # Same call shape as numba.njit(...), but leaves the function as is
+        return lambda fn: fn
+
+
+@njit(cache=True)
+def efficacy_kernel(auc: float, cmax: float, stability: float) -> float:
+    return (0.5 * auc) + (0.3 * cmax) + (0.2 * stability * 100.0)
+
+
+@njit(cache=True)
+def toxicity_kernel(size_nm: float, zeta_mV: float, dose: float, pdi: float, material_prior: float) -> float:
+    # Branchless: each risk bin contributes its weight times a 0/1 comparison
+    abs_z = abs(zeta_mV)
+    score = (
+        20.0 * (size_nm < 50) + 10.0 * (size_nm > 180)
+        + 25.0 * (abs_z > 25) + 10.0 * ((abs_z > 15) & (abs_z <= 25))
+        + 20.0 * (dose > 10) + 10.0 * ((dose > 5) & (dose <= 10))
+        + 20.0 * (pdi > 0.25) + 10.0 * ((pdi > 0.2) & (pdi <= 0.25))
+        + material_prior
+    )
+    return max(0.0, min(100.0, score))
+
+
+@njit(cache=True)
+def cost_kernel(base: float, ligand: float, payload: float, dose: float, pdi: float) -> float:
+    score = base + ligand + payload + 0.1 * dose + 100.0 * max(0.0, pdi - 0.2)
+    return max(0.0, min(100.0, score))
+
+
+if USE_NUMBA:
+    # Pay the JIT compile once at import rather than inside the first trial
+    efficacy_kernel(1.0, 1.0, 1.0)
+    toxicity_kernel(100.0, 0.0, 1.0, 0.2, 5.0)
+    cost_kernel(30.0, 10.0, 10.0, 1.0, 0.2)
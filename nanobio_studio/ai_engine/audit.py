@@ -3,14 +3,128 @@
 from __future__ import annotations
 
 import json
-from dataclasses import asdict, dataclass
+import re
+import string
+from dataclasses import dataclass, fields, is_dataclass
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional
 
 from nanobio_studio.ai_engine.schema import DesignSpace, ObjectiveWeights
 
+if TYPE_CHECKING:
+    from nanobio_studio.ai_engine.optimizer import OptimizationResult
 
-@dataclass
+try:
+    import orjson
+
+    def _dumps_record(audit: "AuditRecord") -> str:
+        # orjson serializes (nested) dataclasses natively, no dict copy
+        return orjson.dumps(
+            audit, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+        ).decode()
+except ImportError:
+    def _dumps_record(audit: "AuditRecord") -> str:
+        return json.dumps(_audit_to_dict(audit), indent=2)
+
+
+# HTML text escaping, applied in a single translate pass
+_ESC_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+_NEEDS_ESCAPE = re.compile(r"[&<>]").search
+
+
+def _esc_text(s: str) -> str:
+    # most fields (timestamps, numbers, keys) need no escaping
+    return s.translate(_ESC_TABLE) if _NEEDS_ESCAPE(s) else s
+
+
+# Scenario name/key/description repeat across every audit of a preset
+_esc_scenario_text = lru_cache(maxsize=256)(_esc_text)
+_SCENARIO_FIELDS = ("scenario_name", "scenario_key", "scenario_description")
+
+
+# Report template, parsed once; every placeholder is filled with escaped text
+_HTML_SOURCE = """<!doctype html>
+<html>
+<head>
+  <meta charset="utf-8" />
+  <title>NanoBio Studio — AI Decision Audit Report</title>
+  <style>
+    body { font-family: Arial, sans-serif; margin: 28px; }
+    h1 { margin-bottom: 0; }
+    .sub { color:#444; margin-top:6px; }
+    .box { border: 1px solid #ddd; padding: 14px; border-radius: 10px; margin: 14px 0; }
+    table { border-collapse: collapse; width: 100%; }
+    td, th { border: 1px solid #ddd; padding: 8px; text-align: left; }
+    th { background: #f5f5f5; }
+    .small { color:#555; font-size: 13px; }
+  </style>
+</head>
+<body>
+  <h1>NanoBio Studio — AI Decision Audit Report</h1>
+  <div class="sub">Timestamp (UTC): ${timestamp_utc}</div>
+
+  <div class="box">
+    <h2>Scenario / Policy Context</h2>
+    <p><b>Scenario:</b> ${scenario_name} (key: ${scenario_key})</p>
+    <p class="small">${scenario_description}</p>
+  </div>
+
+  <div class="box">
+    <h2>Run Configuration</h2>
+    <p><b>Weights</b>: ${weights}</p>
+    <p><b>Constraints</b>: ${constraints}</p>
+    <p><b>Run settings</b>: ${run_settings}</p>
+  </div>
+
+  <div class="box">
+    <h2>Best Candidate Summary</h2>
+    <table>
+      <tr><th>Parameter</th><th>Value</th></tr>
+      <tr><td>Size (nm)</td><td>${size_nm}</td></tr>
+      <tr><td>Zeta (mV)</td><td>${zeta_mV}</td></tr>
+      <tr><td>Material</td><td>${material}</td></tr>
+      <tr><td>Ligand</td><td>${ligand}</td></tr>
+      <tr><td>Payload</td><td>${payload}</td></tr>
+      <tr><td>Dose (mg/kg)</td><td>${dose_mg_per_kg}</td></tr>
+      <tr><td>PDI</td><td>${pdi}</td></tr>
+    </table>
+    <br/>
+    <table>
+      <tr><th>Metric</th><th>Value</th></tr>
+      <tr><td>Efficacy</td><td>${efficacy}</td></tr>
+      <tr><td>Toxicity</td><td>${toxicity}</td></tr>
+      <tr><td>Cost</td><td>${cost}</td></tr>
+      <tr><td>Confidence</td><td>${confidence}</td></tr>
+    </table>
+
+    <p><b>Key Drivers:</b> ${drivers}</p>
+  </div>
+
+  <div class="box">
+    <h2>Evidence of AI Value</h2>
+    <p><b>Best trial value:</b> ${best_trial_value}</p>
+    <p><b>Best parameters:</b> ${best_params}</p>
+    <p><b>Baseline Summary:</b> ${baseline_summary}</p>
+    <p><b>Explainability Summary:</b> ${explainability_summary}</p>
+  </div>
+
+  <div class="box small">
+    <b>Disclaimer:</b> Research and educational use only. Outputs require experimental validation.
+  </div>
+</body>
+</html>"""
+
+# The template split before each <div class="box">, so reports can be streamed
+_HTML_CHUNKS = tuple(
+    string.Template(chunk) for chunk in re.split(r'(?=\n\n  <div class="box)', _HTML_SOURCE)
+)
+
+_DESIGN_KEYS = ("size_nm", "zeta_mV", "material", "ligand", "payload", "dose_mg_per_kg", "pdi")
+_SCORE_KEYS = ("efficacy", "toxicity", "cost", "confidence")
+
+
+@dataclass(slots=True)
 class AuditRecord:
     timestamp_utc: str
     scenario_name: str
@@ -21,7 +135,9 @@ class AuditRecord:
     user_id: Optional[str] = None
 
     # configuration
-    design_space: Dict[str, Any] = None
+    # design_space holds the DesignSpace itself; audit_to_json expands it,
+    # so no copy is made unless the record is serialized
+    design_space: Any = None
     weights: Dict[str, float] = None
     constraints: Dict[str, Any] = None
     run_settings: Dict[str, Any] = None
@@ -36,8 +152,35 @@ class AuditRecord:
     explainability_summary: Optional[Dict[str, Any]] = None
 
 
+def _audit_to_dict(a: AuditRecord) -> Dict[str, Any]:
+    """
+    Plain-dict view of an audit record for serializers (same layout as
+    dataclasses.asdict, without its generic recursion and deep copies).
+    """
+    space = a.design_space
+    if is_dataclass(space):
+        space = {f.name: getattr(space, f.name) for f in fields(space)}
+    return {
+        "timestamp_utc": a.timestamp_utc,
+        "scenario_name": a.scenario_name,
+        "scenario_key": a.scenario_key,
+        "project_id": a.project_id,
+        "user_id": a.user_id,
+        "design_space": space,
+        "weights": a.weights,
+        "constraints": a.constraints,
+        "run_settings": a.run_settings,
+        "best_trial_value": a.best_trial_value,
+        "best_params": a.best_params,
+        "best_candidate": a.best_candidate,
+        "baseline_summary": a.baseline_summary,
+        "explainability_summary": a.explainability_summary,
+    }
+
+
 def utc_now_iso() -> str:
-    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    # isoformat() skips strftime's per-call format parsing; same "...Z" output
+    return datetime.now(timezone.utc).replace(microsecond=0, tzinfo=None).isoformat() + "Z"
 
 
 def build_audit_record(
@@ -52,7 +195,7 @@ def build_audit_record(
         timestamp_utc=utc_now_iso(),
         scenario_name=scenario_name,
         scenario_key=scenario_key,
-        design_space=asdict(space),
+        design_space=space,
         weights={"efficacy": weights.efficacy, "safety": weights.safety, "cost": weights.cost},
         constraints=constraints,
         run_settings=run_settings,
@@ -61,12 +204,15 @@ def build_audit_record(
 
 def record_outcome(
     audit: AuditRecord,
-    res,
+    res: OptimizationResult,
     baseline_summary: Optional[Dict[str, Any]] = None,
     explainability_summary: Optional[Dict[str, Any]] = None,
 ) -> AuditRecord:
-    audit.best_trial_value = float(res.study.best_value) if getattr(res, "study", None) else None
-    audit.best_params = dict(res.study.best_params) if getattr(res, "study", None) else None
+    # study.best_value / best_params each re-scan the trials; fetch best_trial once
+    best_trial = res.study.best_trial if res.study is not None else None
+    audit.best_trial_value = float(best_trial.value) if best_trial else None
+    # best_trial is already a copy from the study storage, so no dict() copy here
+    audit.best_params = best_trial.params if best_trial else None
 
     best = res.best
     audit.best_candidate = {
@@ -94,92 +240,63 @@ def record_outcome(
 
 
 def audit_to_json(audit: AuditRecord) -> str:
-    return json.dumps(asdict(audit), indent=2)
+    return _dumps_record(audit)
+
+
+def audit_to_cbor(audit: AuditRecord) -> bytes:
+    """
+    Compact binary (CBOR) form of the audit record, for machine consumers
+    such as dashboards ingesting sweep audit trails. Requires cbor2.
+    """
+    try:
+        import cbor2
+    except ImportError:
+        raise ImportError("cbor2 is required for CBOR audit export. Install with: pip install cbor2")
+    return cbor2.dumps(_audit_to_dict(audit))
 
 
 def audit_to_html(audit: AuditRecord) -> str:
     """
     Simple, printable HTML report (government-friendly).
     """
-    def esc(x: Any) -> str:
-        s = "" if x is None else str(x)
-        return (
-            s.replace("&", "&amp;")
-             .replace("<", "&lt;")
-             .replace(">", "&gt;")
-        )
+    return "".join(audit_to_html_stream(audit))
+
 
+def audit_to_html_stream(audit: AuditRecord) -> Iterator[str]:
+    """
+    Yield the audit_to_html report in chunks (header, one per section box,
+    footer) so callers can write it straight to a file or HTTP response.
+    """
     best = audit.best_candidate or {}
     design = (best.get("design") or {})
     scores = (best.get("scores") or {})
 
-    return f"""<!doctype html>
-<html>
-<head>
-  <meta charset="utf-8" />
-  <title>NanoBio Studio — AI Decision Audit Report</title>
-  <style>
-    body {{ font-family: Arial, sans-serif; margin: 28px; }}
-    h1 {{ margin-bottom: 0; }}
-    .sub {{ color:#444; margin-top:6px; }}
-    .box {{ border: 1px solid #ddd; padding: 14px; border-radius: 10px; margin: 14px 0; }}
-    table {{ border-collapse: collapse; width: 100%; }}
-    td, th {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
-    th {{ background: #f5f5f5; }}
-    .small {{ color:#555; font-size: 13px; }}
-  </style>
-</head>
-<body>
-  <h1>NanoBio Studio — AI Decision Audit Report</h1>
-  <div class="sub">Timestamp (UTC): {esc(audit.timestamp_utc)}</div>
-
-  <div class="box">
-    <h2>Scenario / Policy Context</h2>
-    <p><b>Scenario:</b> {esc(audit.scenario_name)} (key: {esc(audit.scenario_key)})</p>
-    <p class="small">{esc((audit.constraints or {}).get("scenario_description",""))}</p>
-  </div>
-
-  <div class="box">
-    <h2>Run Configuration</h2>
-    <p><b>Weights</b>: {esc(audit.weights)}</p>
-    <p><b>Constraints</b>: {esc(audit.constraints)}</p>
-    <p><b>Run settings</b>: {esc(audit.run_settings)}</p>
-  </div>
-
-  <div class="box">
-    <h2>Best Candidate Summary</h2>
-    <table>
-      <tr><th>Parameter</th><th>Value</th></tr>
-      <tr><td>Size (nm)</td><td>{esc(design.get("size_nm"))}</td></tr>
-      <tr><td>Zeta (mV)</td><td>{esc(design.get("zeta_mV"))}</td></tr>
-      <tr><td>Material</td><td>{esc(design.get("material"))}</td></tr>
-      <tr><td>Ligand</td><td>{esc(design.get("ligand"))}</td></tr>
-      <tr><td>Payload</td><td>{esc(design.get("payload"))}</td></tr>
-      <tr><td>Dose (mg/kg)</td><td>{esc(design.get("dose_mg_per_kg"))}</td></tr>
-      <tr><td>PDI</td><td>{esc(design.get("pdi"))}</td></tr>
-    </table>
-    <br/>
-    <table>
-      <tr><th>Metric</th><th>Value</th></tr>
-      <tr><td>Efficacy</td><td>{esc(scores.get("efficacy"))}</td></tr>
-      <tr><td>Toxicity</td><td>{esc(scores.get("toxicity"))}</td></tr>
-      <tr><td>Cost</td><td>{esc(scores.get("cost"))}</td></tr>
-      <tr><td>Confidence</td><td>{esc(scores.get("confidence"))}</td></tr>
-    </table>
-
-    <p><b>Key Drivers:</b> {esc(", ".join(best.get("drivers", [])))}</p>
-  </div>
+    scenario = (
+        audit.scenario_name,
+        audit.scenario_key,
+        (audit.constraints or {}).get("scenario_description", ""),
+    )
+    mapping = {
+        key: "" if value is None else _esc_scenario_text(str(value))
+        for key, value in zip(_SCENARIO_FIELDS, scenario)
+    }
 
-  <div class="box">
-    <h2>Evidence of AI Value</h2>
-    <p><b>Best trial value:</b> {esc(audit.best_trial_value)}</p>
-    <p><b>Best parameters:</b> {esc(audit.best_params)}</p>
-    <p><b>Baseline Summary:</b> {esc(audit.baseline_summary)}</p>
-    <p><b>Explainability Summary:</b> {esc(audit.explainability_summary)}</p>
-  </div>
+    fields = {
+        "timestamp_utc": audit.timestamp_utc,
+        "weights": audit.weights,
+        "constraints": audit.constraints,
+        "run_settings": audit.run_settings,
+        "drivers": ", ".join(best.get("drivers", [])),
+        "best_trial_value": audit.best_trial_value,
+        "best_params": audit.best_params,
+        "baseline_summary": audit.baseline_summary,
+        "explainability_summary": audit.explainability_summary,
+    }
+    fields.update((key, design.get(key)) for key in _DESIGN_KEYS)
+    fields.update((key, scores.get(key)) for key in _SCORE_KEYS)
 
-  <div class="box small">
-    <b>Disclaimer:</b> Research and educational use only. Outputs require experimental validation.
-  </div>
-</body>
-</html>"""
+    mapping.update(
+        (key, "" if value is None else _esc_text(str(value))) for key, value in fields.items()
+    )
+    for chunk in _HTML_CHUNKS:
+        yield chunk.substitute(mapping)
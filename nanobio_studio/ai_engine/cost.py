@@ -1,14 +1,54 @@
+from typing import Sequence
+
+import numpy as np
+
 from nanobio_studio.core.types import NanoDesign
+from nanobio_studio.ai_engine._scoring_kernels import cost_kernel
+
+# Cost components per choice (value, default for unknown choices)
+_MATERIAL_COST = {"PLGA": 30, "Lipid": 40, "Gold": 60}
+_LIGAND_COST = {"None": 0, "PEG": 10, "Folate": 20}
+_PAYLOAD_COST = {"DrugA": 10, "DrugB": 20}
+_MATERIAL_DEFAULT, _LIGAND_DEFAULT, _PAYLOAD_DEFAULT = 45, 10, 15
 
 def cost_score_proxy(design: NanoDesign) -> float:
     """
     Phase-1: proxy cost/complexity index (0..100).
     Replace with your real NanoBio Studio cost model.
     """
-    base = {"PLGA": 30, "Lipid": 40, "Gold": 60}.get(design.material, 45)
-    ligand = {"None": 0, "PEG": 10, "Folate": 20}.get(design.ligand, 10)
-    payload = {"DrugA": 10, "DrugB": 20}.get(design.payload, 15)
-    scale = 0.1 * design.dose_mg_per_kg
-    pdi_penalty = 100 * max(0.0, design.pdi - 0.2)
+    return cost_kernel(
+        float(_MATERIAL_COST.get(design.material, _MATERIAL_DEFAULT)),
+        float(_LIGAND_COST.get(design.ligand, _LIGAND_DEFAULT)),
+        float(_PAYLOAD_COST.get(design.payload, _PAYLOAD_DEFAULT)),
+        float(design.dose_mg_per_kg),
+        float(design.pdi),
+    )
+
+def cost_score_batch(
+    materials: Sequence[str],
+    ligands: Sequence[str],
+    payloads: Sequence[str],
+    dose_mg_per_kg: Sequence[float],
+    pdi: Sequence[float],
+) -> np.ndarray:
+    """
+    Vectorized cost_score_proxy over parallel arrays (one entry per design).
+    Returns a float array with the same values as calling cost_score_proxy per design.
+    """
+    base = np.fromiter((_MATERIAL_COST.get(m, _MATERIAL_DEFAULT) for m in materials), float, len(materials))
+    ligand = np.fromiter((_LIGAND_COST.get(l, _LIGAND_DEFAULT) for l in ligands), float, len(ligands))
+    payload = np.fromiter((_PAYLOAD_COST.get(p, _PAYLOAD_DEFAULT) for p in payloads), float, len(payloads))
+    scale = 0.1 * np.asarray(dose_mg_per_kg, dtype=float)
+    pdi_penalty = 100 * np.maximum(0.0, np.asarray(pdi, dtype=float) - 0.2)
     score = base + ligand + payload + scale + pdi_penalty
-    return float(max(0.0, min(100.0, score)))
+    return np.clip(score, 0.0, 100.0, out=score)
+
+def cost_scores(designs: Sequence[NanoDesign]) -> np.ndarray:
+    """cost_score_batch for a list of NanoDesign objects."""
+    return cost_score_batch(
+        [d.material for d in designs],
+        [d.ligand for d in designs],
+        [d.payload for d in designs],
+        [d.dose_mg_per_kg for d in designs],
+        [d.pdi for d in designs],
+    )
@@ -23,8 +23,12 @@ Usage:
 from __future__ import annotations
 
 import logging
+import queue
+import sys
+import threading
+import weakref
 from dataclasses import dataclass
-from typing import Dict, Optional, Any, List, Callable
+from typing import Dict, Optional, Any, List, Callable, Mapping
 
 from nanobio_studio.ai_engine.schema import DesignSpace, ObjectiveWeights
 from nanobio_studio.ai_engine.optimizer import run_optimization, OptimizationResult
@@ -33,7 +37,9 @@ from nanobio_studio.ai_engine.audit import (
     build_audit_record,
     record_outcome,
     audit_to_json,
+    audit_to_cbor,
     audit_to_html,
+    utc_now_iso,
     AuditRecord,
 )
 from nanobio_studio.ai_engine.explainability import explain_design
@@ -43,11 +49,78 @@ from nanobio_studio.ai_engine.simulator_adapter import SimulateFn
 
 # Configure logging
 logger = logging.getLogger(__name__)
+_LOG_FORMATTER = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_LOG_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
 
+# Background audit writer: pending runs are capped, and drained in batches
+_AUDIT_QUEUE_SIZE = 1024
+_AUDIT_BATCH_SIZE = 100
 
-@dataclass
+# One writer thread per process, shared by every engine and started on first use.
+# Queue items are (weakref to engine, job); the worker never keeps an engine alive.
+_audit_queue: queue.Queue = queue.Queue(maxsize=_AUDIT_QUEUE_SIZE)
+_audit_worker: Optional[threading.Thread] = None
+_audit_worker_lock = threading.Lock()
+
+
+def _ensure_audit_worker() -> None:
+    """Start the shared audit writer thread if it is not running yet"""
+    global _audit_worker
+    if _audit_worker is not None:
+        return
+    with _audit_worker_lock:
+        if _audit_worker is None:
+            _audit_worker = threading.Thread(
+                target=_drain_audit_queue, name="audit-writer", daemon=True
+            )
+            _audit_worker.start()
+
+
+def _drain_audit_queue() -> None:
+    """Worker loop: build queued audit records and append them in batches"""
+    while True:
+        batch = [_audit_queue.get()]
+        while len(batch) < _AUDIT_BATCH_SIZE:
+            try:
+                batch.append(_audit_queue.get_nowait())
+            except queue.Empty:
+                break
+        
+        # Records grouped per engine; jobs of collected engines are dropped
+        records: Dict[int, tuple] = {}
+        for engine_ref, job in batch:
+            engine = engine_ref()
+            if engine is None:
+                continue
+            try:
+                record = AIEngine._build_audit(**job)
+            except Exception as e:
+                logger.error(f"Audit record failed: {str(e)}", exc_info=True)
+                continue
+            records.setdefault(id(engine), (engine, []))[1].append(record)
+        
+        for engine, engine_records in records.values():
+            with engine._audit_lock:
+                engine.audit_trail.extend(engine_records)
+        # Drop the strong references before blocking on the next get()
+        records = engine = None
+        for _ in batch:
+            _audit_queue.task_done()
+        batch = None
+
+# Used by explain_best when no run has recorded its weights yet
+_DEFAULT_EXPLAIN_WEIGHTS = ObjectiveWeights(efficacy=0.5, safety=0.3, cost=0.2)
+
+
+@dataclass(frozen=True, **({"slots": True} if sys.version_info >= (3, 10) else {}))
 class EngineConfig:
-    """Configuration for AI Engine"""
+    """Configuration for AI Engine (immutable; AIEngine caches its values)"""
     log_level: str = "INFO"
     enable_audit: bool = True
     enable_sensitivity: bool = True
@@ -82,21 +155,71 @@ class AIEngine:
         """
         self.simulate_fn = simulate_fn
         self.config = config or EngineConfig()
+        # Hot-path settings, read once (EngineConfig is frozen)
+        self._seed = self.config.seed
+        self._max_n_trials = self.config.max_n_trials
+        self._default_n_trials = self.config.default_n_trials
+        self._enable_audit = self.config.enable_audit
+        self._enable_sensitivity = self.config.enable_sensitivity
         self._setup_logging()
         self.audit_trail: List[AuditRecord] = []
+        self._last_weights: Optional[ObjectiveWeights] = None
+        
+        # Audit records are assembled off the optimization path, by the
+        # shared writer thread (started on the first queued run)
+        self._audit_lock = threading.Lock()
         
     def _setup_logging(self):
         """Configure logging"""
-        logger.setLevel(getattr(logging, self.config.log_level))
+        logger.setLevel(_LOG_LEVELS[self.config.log_level])
         if not logger.handlers:
             handler = logging.StreamHandler()
-            formatter = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-            )
-            handler.setFormatter(formatter)
+            handler.setFormatter(_LOG_FORMATTER)
             logger.addHandler(handler)
     
-    def get_available_scenarios(self) -> Dict[str, ScenarioPreset]:
+    @staticmethod
+    def _build_audit(
+        timestamp_utc: str,
+        scenario: ScenarioPreset,
+        scenario_key: str,
+        design_space: DesignSpace,
+        constraints: Dict[str, Any],
+        run_settings: Dict[str, Any],
+        project_id: Optional[str],
+        user_id: Optional[str],
+        result: OptimizationResult,
+    ) -> AuditRecord:
+        """Assemble the audit record for one completed scenario run"""
+        audit = build_audit_record(
+            scenario_name=scenario.title,
+            scenario_key=scenario_key,
+            space=design_space,
+            weights=scenario.weights,
+            constraints=constraints,
+            run_settings=run_settings,
+        )
+        audit.timestamp_utc = timestamp_utc
+        audit.project_id = project_id
+        audit.user_id = user_id
+        return record_outcome(
+            audit,
+            result,
+            baseline_summary={
+                "n_candidates": result.summary["n"],
+                "best_score": float(result.best.efficacy),
+                "worst_toxicity": result.summary["max_toxicity"],
+            },
+            explainability_summary={
+                "top_driver": result.best.drivers[0] if result.best.drivers else "N/A",
+                "confidence": float(result.best.confidence),
+            }
+        )
+    
+    def flush_audit(self):
+        """Block until every queued audit record is in the audit trail"""
+        _audit_queue.join()
+    
+    def get_available_scenarios(self) -> Mapping[str, ScenarioPreset]:
         """Get all available optimization scenarios"""
         return get_scenarios()
     
@@ -167,9 +290,11 @@ class AIEngine:
         scenarios = self.get_available_scenarios()
         scenario = scenarios[scenario_key]
         
+        self._last_weights = scenario.weights
+        
         # Use scenario defaults if not overridden
         n_trials = n_trials or scenario.recommended_trials
-        n_trials = min(n_trials, self.config.max_n_trials)
+        n_trials = min(n_trials, self._max_n_trials)
         
         logger.info(f"Using {n_trials} trials, scenario: {scenario.title}")
         
@@ -180,23 +305,8 @@ class AIEngine:
         if scenario.cost_max is not None:
             constraints["cost_max"] = scenario.cost_max
         
-        # Create audit record
-        audit = None
-        if self.config.enable_audit:
-            audit = build_audit_record(
-                scenario_name=scenario.title,
-                scenario_key=scenario_key,
-                space=design_space,
-                weights=scenario.weights,
-                constraints=constraints,
-                run_settings={
-                    "n_trials": n_trials,
-                    "seed": self.config.seed,
-                    "top_k": top_k,
-                },
-            )
-            audit.project_id = project_id
-            audit.user_id = user_id
+        # Audit timestamp marks the start of the run
+        started_at = utc_now_iso()
         
         # Run optimization
         try:
@@ -204,28 +314,30 @@ class AIEngine:
                 space=design_space,
                 weights=scenario.weights,
                 n_trials=n_trials,
-                seed=self.config.seed,
+                seed=self._seed,
                 simulate_fn=self.simulate_fn,
                 top_k=top_k,
                 constraints=constraints,
             )
             
-            # Record outcome
-            if audit and self.config.enable_audit:
-                audit = record_outcome(
-                    audit,
-                    result,
-                    baseline_summary={
-                        "n_candidates": len(result.candidates),
-                        "best_score": float(result.best.efficacy),
-                        "worst_toxicity": max(c.toxicity for c in result.candidates),
+            # Record outcome (built by the audit worker)
+            if self._enable_audit:
+                _ensure_audit_worker()
+                _audit_queue.put((weakref.ref(self), {
+                    "timestamp_utc": started_at,
+                    "scenario": scenario,
+                    "scenario_key": scenario_key,
+                    "design_space": design_space,
+                    "constraints": constraints,
+                    "run_settings": {
+                        "n_trials": n_trials,
+                        "seed": self._seed,
+                        "top_k": top_k,
                     },
-                    explainability_summary={
-                        "top_driver": result.best.drivers[0] if result.best.drivers else "N/A",
-                        "confidence": float(result.best.confidence),
-                    }
-                )
-                self.audit_trail.append(audit)
+                    "project_id": project_id,
+                    "user_id": user_id,
+                    "result": result,
+                }))
             
             logger.info(
                 f"Optimization completed: "
@@ -269,8 +381,10 @@ class AIEngine:
             logger.error("Invalid design space")
             return None
         
-        n_trials = n_trials or self.config.default_n_trials
-        n_trials = min(n_trials, self.config.max_n_trials)
+        self._last_weights = weights
+        
+        n_trials = n_trials or self._default_n_trials
+        n_trials = min(n_trials, self._max_n_trials)
         constraints = constraints or {}
         
         try:
@@ -278,7 +392,7 @@ class AIEngine:
                 space=design_space,
                 weights=weights,
                 n_trials=n_trials,
-                seed=self.config.seed,
+                seed=self._seed,
                 simulate_fn=self.simulate_fn,
                 constraints=constraints,
             )
@@ -320,10 +434,12 @@ class AIEngine:
             result: OptimizationResult
             design_space: Optional DesignSpace for clipping perturbations
             
+        Uses the weights of the most recent run_scenario/run_custom call.
+            
         Returns:
             Dictionary with metrics, drivers, and sensitivity analysis
         """
-        if not self.config.enable_sensitivity:
+        if not self._enable_sensitivity:
             logger.warning("Sensitivity analysis disabled")
             return None
         
@@ -333,11 +449,7 @@ class AIEngine:
             # Run sensitivity analysis
             metrics, drivers, sensitivity = explain_design(
                 design=best.design,
-                weights=ObjectiveWeights(
-                    efficacy=0.5,  # Would come from optimization weights
-                    safety=0.3,
-                    cost=0.2,
-                ),
+                weights=self._last_weights or _DEFAULT_EXPLAIN_WEIGHTS,
                 simulate_fn=self.simulate_fn,
                 space=design_space,
             )
@@ -365,7 +477,7 @@ class AIEngine:
     def get_dataframe_report(self, result: OptimizationResult):
         """Get pandas DataFrame with all candidates for spreadsheet export"""
         try:
-            df = candidates_to_df(result.candidates)
+            df = candidates_to_df(result.candidates, result.columns)
             logger.info(f"Generated DataFrame with {len(df)} candidates")
             return df
         except Exception as e:
@@ -376,17 +488,39 @@ class AIEngine:
         """Get JSON audit record"""
         return audit_to_json(audit)
     
+    def get_audit_payload(self, audit: AuditRecord, accept: str = "application/json"):
+        """
+        Get the audit record in the best format the consumer accepts
+        
+        Args:
+            audit: AuditRecord to serialize
+            accept: Consumer's Accept header / MIME list
+            
+        Returns:
+            (payload, mime_type): CBOR bytes when "application/cbor" is
+            accepted and cbor2 is installed, otherwise the JSON string
+        """
+        if "application/cbor" in accept:
+            try:
+                return audit_to_cbor(audit), "application/cbor"
+            except ImportError:
+                logger.warning("cbor2 not installed, falling back to JSON audit")
+        return audit_to_json(audit), "application/json"
+    
     def get_html_report(self, audit: AuditRecord) -> str:
         """Get HTML audit report (suitable for printing)"""
         return audit_to_html(audit)
     
     def get_audit_trail(self) -> List[AuditRecord]:
         """Get all audit records from this session"""
+        self.flush_audit()
         return self.audit_trail
     
     def clear_audit_trail(self):
         """Clear audit trail"""
-        self.audit_trail.clear()
+        self.flush_audit()
+        with self._audit_lock:
+            self.audit_trail.clear()
         logger.info("Audit trail cleared")
 
 
@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Dict, List, Tuple
 
 from nanobio_studio.core.types import NanoDesign
 from nanobio_studio.ai_engine.schema import ObjectiveWeights
-from nanobio_studio.ai_engine.objectives import efficacy_proxy
-from nanobio_studio.ai_engine.toxicity import toxicity_score_hybrid
+from nanobio_studio.ai_engine.objectives import batch_score, efficacy_proxy
+from nanobio_studio.ai_engine.toxicity import toxicity_drivers, toxicity_score_hybrid
 from nanobio_studio.ai_engine.cost import cost_score_proxy
 
 
@@ -31,26 +31,27 @@ class SensitivityResult:
     cost_change: float
 
 
-def _scalar_score(weights: ObjectiveWeights, eff: float, tox: float, cost: float) -> float:
+def _weight_vector(weights: ObjectiveWeights) -> Tuple[float, float, float]:
+    # unpacked once per explanation; _scalar_score then reads plain floats
     w = weights.normalized()
-    return float((w.efficacy * eff) - (w.safety * tox) - (w.cost * cost))
+    return float(w.efficacy), float(w.safety), float(w.cost)
+
+
+def _scalar_score(w: Tuple[float, float, float], eff: float, tox: float, cost: float) -> float:
+    w_eff, w_safe, w_cost = w
+    return (w_eff * eff) - (w_safe * tox) - (w_cost * cost)
+
+
+def _design_key(d: NanoDesign) -> Tuple:
+    return (d.size_nm, d.zeta_mV, d.material, d.ligand, d.payload, d.dose_mg_per_kg, d.pdi)
 
 
 def _clip(value: float, lo: float, hi: float) -> float:
     return float(max(lo, min(hi, value)))
 
 
-def _clone_design(d: NanoDesign) -> NanoDesign:
-    return NanoDesign(
-        size_nm=float(d.size_nm),
-        zeta_mV=float(d.zeta_mV),
-        material=str(d.material),
-        ligand=str(d.ligand),
-        payload=str(d.payload),
-        dose_mg_per_kg=float(d.dose_mg_per_kg),
-        pdi=float(d.pdi),
-        extra=dict(d.extra or {}),
-    )
+# Parameters the sensitivity probes may perturb
+_PERTURBABLE = ("size_nm", "zeta_mV", "dose_mg_per_kg")
 
 
 def explain_design(
@@ -67,67 +68,27 @@ def explain_design(
     3) Sensitivity analysis (small perturbations) on size/charge/dose
 
     - simulate_fn: same simulator function used by optimizer (placeholder or real)
+      (if it exposes `simulate_fn.batch`, all probes are simulated in one batch call)
     - space: optional DesignSpace, used only to clip perturbations into allowed ranges
     - deltas: optional dict like {"size_nm": 10.0, "zeta_mV": 5.0, "dose_mg_per_kg": 2.0}
     """
     if deltas is None:
         deltas = {"size_nm": 10.0, "zeta_mV": 5.0, "dose_mg_per_kg": 2.0}
 
-    # ---- base evaluation ----
-    base_sim = simulate_fn(design)
-    base_eff = float(efficacy_proxy(base_sim))
-    base_tox, base_drivers = toxicity_score_hybrid(design, base_sim)
-    base_tox = float(base_tox)
-    base_cost = float(cost_score_proxy(design))
-    base_score = _scalar_score(weights, base_eff, base_tox, base_cost)
+    w = _weight_vector(weights)
 
-    base_summary = {
-        "score": base_score,
-        "efficacy": base_eff,
-        "toxicity": base_tox,
-        "cost": base_cost,
-    }
+    # Probes that clip back onto the base value (or use a zero delta) reuse
+    # the base evaluation instead of re-running the simulator
+    evaluated: Dict[Tuple, Tuple[float, float, float]] = {}
 
-    # ---- sensitivity analysis ----
-    sens: List[SensitivityResult] = []
-
-    def eval_with_mutation(param: str, new_value: float, direction: str, delta: float) -> SensitivityResult:
-        d2 = _clone_design(design)
-
-        # apply mutation
-        if param == "size_nm":
-            d2.size_nm = float(new_value)
-        elif param == "zeta_mV":
-            d2.zeta_mV = float(new_value)
-        elif param == "dose_mg_per_kg":
-            d2.dose_mg_per_kg = float(new_value)
-        else:
-            raise ValueError(f"Unknown parameter: {param}")
-
-        sim2 = simulate_fn(d2)
-        eff2 = float(efficacy_proxy(sim2))
-        tox2, _ = toxicity_score_hybrid(d2, sim2)
-        tox2 = float(tox2)
-        cost2 = float(cost_score_proxy(d2))
-        score2 = _scalar_score(weights, eff2, tox2, cost2)
-
-        return SensitivityResult(
-            param=param,
-            direction=direction,
-            delta=float(delta),
-            base_score=base_score,
-            new_score=score2,
-            score_change=float(score2 - base_score),
-            base_eff=base_eff,
-            new_eff=eff2,
-            eff_change=float(eff2 - base_eff),
-            base_tox=base_tox,
-            new_tox=tox2,
-            tox_change=float(tox2 - base_tox),
-            base_cost=base_cost,
-            new_cost=cost2,
-            cost_change=float(cost2 - base_cost),
-        )
+    def evaluate(d: NanoDesign) -> Tuple[float, float, float]:
+        key = _design_key(d)
+        hit = evaluated.get(key)
+        if hit is None:
+            sim = simulate_fn(d)
+            tox, _ = toxicity_score_hybrid(d, sim, with_drivers=False)
+            hit = evaluated[key] = (efficacy_proxy(sim), tox, cost_score_proxy(d))
+        return hit
 
     # optional clipping ranges if DesignSpace provided
     def get_bounds(param: str) -> Tuple[float, float]:
@@ -150,29 +111,61 @@ def explain_design(
             return float(space.dose_min), float(space.dose_max)
         return -1e9, 1e9
 
+    # ---- perturbed designs: one (+) and one (-) probe per parameter ----
+    probes: List[Tuple[str, str, float, NanoDesign]] = []
     for p, dlt in deltas.items():
+        if p not in _PERTURBABLE:
+            continue
         lo, hi = get_bounds(p)
+        base_val = float(getattr(design, p))
+        dlt = float(dlt)
+        for direction, new_val in (("+", base_val + dlt), ("-", base_val - dlt)):
+            # `extra` is shared with the base design (never mutated here)
+            probes.append((p, direction, dlt, replace(design, **{p: _clip(new_val, lo, hi)})))
+
+    # A batch-capable simulator runs the base design and all distinct probes in one call
+    simulate_batch = getattr(simulate_fn, "batch", None)
+    if simulate_batch is not None:
+        pending: Dict[Tuple, NanoDesign] = {}
+        for d in (design, *(probe[3] for probe in probes)):
+            pending.setdefault(_design_key(d), d)
+        batch = list(pending.values())
+        effs, toxs, costs = batch_score(batch, simulate_batch(batch))
+        evaluated.update(zip(pending, zip(effs.tolist(), toxs.tolist(), costs.tolist())))
 
-        # plus
-        if p == "size_nm":
-            new_val = _clip(float(design.size_nm) + float(dlt), lo, hi)
-        elif p == "zeta_mV":
-            new_val = _clip(float(design.zeta_mV) + float(dlt), lo, hi)
-        elif p == "dose_mg_per_kg":
-            new_val = _clip(float(design.dose_mg_per_kg) + float(dlt), lo, hi)
-        else:
-            continue
-        sens.append(eval_with_mutation(p, new_val, "+", float(dlt)))
-
-        # minus
-        if p == "size_nm":
-            new_val = _clip(float(design.size_nm) - float(dlt), lo, hi)
-        elif p == "zeta_mV":
-            new_val = _clip(float(design.zeta_mV) - float(dlt), lo, hi)
-        elif p == "dose_mg_per_kg":
-            new_val = _clip(float(design.dose_mg_per_kg) - float(dlt), lo, hi)
-        else:
-            continue
-        sens.append(eval_with_mutation(p, new_val, "-", float(dlt)))
+    # ---- base evaluation ----
+    base_eff, base_tox, base_cost = evaluate(design)
+    base_score = _scalar_score(w, base_eff, base_tox, base_cost)
+    base_drivers = toxicity_drivers(design)
+
+    base_summary = {
+        "score": base_score,
+        "efficacy": base_eff,
+        "toxicity": base_tox,
+        "cost": base_cost,
+    }
+
+    # ---- sensitivity analysis ----
+    sens: List[SensitivityResult] = []
+    for param, direction, delta, d2 in probes:
+        eff2, tox2, cost2 = evaluate(d2)
+        score2 = _scalar_score(w, eff2, tox2, cost2)
+        sens.append(SensitivityResult(
+            param=param,
+            direction=direction,
+            delta=delta,
+            base_score=base_score,
+            new_score=score2,
+            score_change=score2 - base_score,
+            base_eff=base_eff,
+            new_eff=eff2,
+            eff_change=eff2 - base_eff,
+            base_tox=base_tox,
+            new_tox=tox2,
+            tox_change=tox2 - base_tox,
+            base_cost=base_cost,
+            new_cost=cost2,
+            cost_change=cost2 - base_cost,
+        ))
 
-    return base_summary, list(base_drivers or []), sens
+    return base_summary, list(base_drivers), sens
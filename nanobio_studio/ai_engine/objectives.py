@@ -1,4 +1,11 @@
-from nanobio_studio.core.types import SimulationResult
+from typing import Sequence, Tuple
+
+import numpy as np
+
+from nanobio_studio.core.types import NanoDesign, SimulationResult
+from nanobio_studio.ai_engine._scoring_kernels import efficacy_kernel
+from nanobio_studio.ai_engine.toxicity import toxicity_scores
+from nanobio_studio.ai_engine.cost import cost_scores
 
 def efficacy_proxy(sim: SimulationResult) -> float:
     """
@@ -6,7 +13,25 @@ def efficacy_proxy(sim: SimulationResult) -> float:
     Keep it simple & explainable in Phase-1.
     """
     # Example: weighted combination
-    return (0.5 * sim.auc_target) + (0.3 * sim.cmax_target) + (0.2 * sim.release_stability * 100.0)
+    return efficacy_kernel(float(sim.auc_target), float(sim.cmax_target), float(sim.release_stability))
+
+def efficacy_scores(sims: Sequence[SimulationResult]) -> np.ndarray:
+    """Vectorized efficacy_proxy over a list of simulation results (same values)."""
+    n = len(sims)
+    auc = np.fromiter((s.auc_target for s in sims), float, n)
+    cmax = np.fromiter((s.cmax_target for s in sims), float, n)
+    stability = np.fromiter((s.release_stability for s in sims), float, n)
+    return (0.5 * auc) + (0.3 * cmax) + (0.2 * stability * 100.0)
+
+def batch_score(
+    designs: Sequence[NanoDesign],
+    sims: Sequence[SimulationResult],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Efficacy, toxicity and cost arrays for a batch of simulated designs,
+    each computed in one NumPy pass (used by the optimizer's batch path).
+    """
+    return efficacy_scores(sims), toxicity_scores(designs), cost_scores(designs)
 
 def scalarized_score(efficacy: float, toxicity: float, cost: float,
                      w_eff: float, w_safe: float, w_cost: float) -> float:
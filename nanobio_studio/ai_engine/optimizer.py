@@ -2,17 +2,22 @@
 
 from __future__ import annotations
 
+import heapq
+import warnings
 from dataclasses import dataclass
-from typing import List, Optional, Dict, Any
+from functools import cached_property
+from typing import Callable, List, Optional, Dict, Any, Sequence
 
+import numpy as np
 import optuna
 
 from nanobio_studio.core.types import NanoDesign, ScoredCandidate
 from nanobio_studio.ai_engine.schema import DesignSpace, ObjectiveWeights
 from nanobio_studio.ai_engine.simulator_adapter import SimulateFn, simulate_design_placeholder
-from nanobio_studio.ai_engine.objectives import efficacy_proxy, scalarized_score
-from nanobio_studio.ai_engine.toxicity import toxicity_score_hybrid
+from nanobio_studio.ai_engine.objectives import batch_score, efficacy_proxy, scalarized_score
+from nanobio_studio.ai_engine.toxicity import toxicity_drivers, toxicity_score_hybrid
 from nanobio_studio.ai_engine.cost import cost_score_proxy
+from nanobio_studio.ai_engine.reporting import candidate_columns
 from nanobio_studio.ai_engine.uncertainty import simple_confidence_from_rules, seed_everything
 
 
@@ -22,35 +27,79 @@ class OptimizationResult:
     best: ScoredCandidate
     study: optuna.Study
 
+    @cached_property
+    def columns(self) -> Dict[str, Sequence[Any]]:
+        """Report columns of the kept candidates (one pass, shared by all summaries)."""
+        return candidate_columns(self.candidates)
+
+    @cached_property
+    def efficacy_array(self) -> np.ndarray:
+        """Efficacy of every kept candidate, for vectorized summaries."""
+        return np.asarray(self.columns["Efficacy"], dtype=float)
+
+    @cached_property
+    def toxicity_array(self) -> np.ndarray:
+        """Toxicity of every kept candidate, for vectorized summaries."""
+        return np.asarray(self.columns["Toxicity (0-100)"], dtype=float)
+
+    @cached_property
+    def cost_array(self) -> np.ndarray:
+        """Cost of every kept candidate, for vectorized summaries."""
+        return np.asarray(self.columns["Cost (0-100)"], dtype=float)
+
+    @cached_property
+    def summary(self) -> Dict[str, Any]:
+        """Count and score extremes of the kept candidates."""
+        return {
+            "n": len(self.candidates),
+            "max_toxicity": float(self.toxicity_array.max()),
+            "min_cost": float(self.cost_array.min()),
+            "best_efficacy": float(self.efficacy_array.max()),
+        }
+
+
+def _design_sampler(space: DesignSpace) -> Callable[[optuna.Trial], NanoDesign]:
+    """
+    Build the per-trial sampler for the configured DesignSpace.
+    The space is constant for a run, so fixed choices and bounds are resolved
+    once here; fixed categories are never suggested (TPE does not model them).
+    """
+    fixed = getattr(space, "fixed", None) or {}
+    fixed_material = fixed.get("material")
+    fixed_ligand = fixed.get("ligand")
+    fixed_payload = fixed.get("payload")
+
+    size_lo, size_hi = space.size_nm_min, space.size_nm_max
+    zeta_lo, zeta_hi = space.charge_mV_min, space.charge_mV_max
+    dose_lo, dose_hi = space.dose_min, space.dose_max
+    materials, ligands, payloads = space.materials, space.ligands, space.payloads
+
+    def suggest(trial: optuna.Trial) -> NanoDesign:
+        size_nm = trial.suggest_float("size_nm", size_lo, size_hi)
+        zeta_mV = trial.suggest_float("zeta_mV", zeta_lo, zeta_hi)
+
+        material = fixed_material or trial.suggest_categorical("material", materials)
+        ligand = fixed_ligand or trial.suggest_categorical("ligand", ligands)
+        payload = fixed_payload or trial.suggest_categorical("payload", payloads)
+
+        dose = trial.suggest_float("dose_mg_per_kg", dose_lo, dose_hi)
+
+        # PDI in Phase-2 is still sampled (can be fixed later).
+        pdi = trial.suggest_float("pdi", 0.12, 0.35)
+
+        # suggest_float/suggest_categorical already return float/str values
+        return NanoDesign(
+            size_nm=size_nm,
+            zeta_mV=zeta_mV,
+            material=material,
+            ligand=ligand,
+            payload=payload,
+            dose_mg_per_kg=dose,
+            pdi=pdi,
+            extra={},
+        )
 
-def _suggest_design(trial: optuna.Trial, space: DesignSpace) -> NanoDesign:
-    """Sample a nanoparticle design from the configured DesignSpace."""
-    size_nm = trial.suggest_float("size_nm", space.size_nm_min, space.size_nm_max)
-    zeta_mV = trial.suggest_float("zeta_mV", space.charge_mV_min, space.charge_mV_max)
-
-    material = space.fixed.get("material") if getattr(space, "fixed", None) else None
-    ligand = space.fixed.get("ligand") if getattr(space, "fixed", None) else None
-    payload = space.fixed.get("payload") if getattr(space, "fixed", None) else None
-
-    material = material or trial.suggest_categorical("material", space.materials)
-    ligand = ligand or trial.suggest_categorical("ligand", space.ligands)
-    payload = payload or trial.suggest_categorical("payload", space.payloads)
-
-    dose = trial.suggest_float("dose_mg_per_kg", space.dose_min, space.dose_max)
-
-    # PDI in Phase-2 is still sampled (can be fixed later).
-    pdi = trial.suggest_float("pdi", 0.12, 0.35)
-
-    return NanoDesign(
-        size_nm=float(size_nm),
-        zeta_mV=float(zeta_mV),
-        material=str(material),
-        ligand=str(ligand),
-        payload=str(payload),
-        dose_mg_per_kg=float(dose),
-        pdi=float(pdi),
-        extra={},
-    )
+    return suggest
 
 
 def run_optimization(
@@ -61,6 +110,8 @@ def run_optimization(
     simulate_fn: SimulateFn = simulate_design_placeholder,
     top_k: int = 10,
     constraints: Optional[Dict[str, Any]] = None,  # ✅ NEW (Scenario Mode constraints)
+    batch_size: int = 1,
+    record_attrs: bool = True,
 ) -> OptimizationResult:
     """
     Phase-2/3 Optimizer:
@@ -71,31 +122,44 @@ def run_optimization(
     - Logs trial attrs for transparency panels (exploration, baseline, audit)
 
     NOTE: Still uses single-objective scalarization (Phase-2), but supports policy constraints (Phase-3).
+
+    batch_size > 1 switches to Optuna's ask-and-tell API: batch_size trials are
+    asked at once, simulated together (through `simulate_fn.batch` when the
+    simulator provides one) and scored with batch_score before being told back. TPE then samples each batch
+    without seeing its siblings' results, so outcomes differ from batch_size=1;
+    the batch sampler uses constant_liar (which relies on the asked-but-not-told
+    trials of the ask-and-tell loop) plus multivariate, grouped TPE.
+
+    record_attrs=False skips the per-trial user attributes (efficacy, toxicity,
+    cost, confidence, pdi, rejected, reject_reason) for runs whose study is not
+    inspected; each set_user_attr is a storage write.
     """
     seed_everything(seed)
     w = weights.normalized()
+    # bound once; the objective and the ranking key read these per candidate
+    w_eff, w_safe, w_cost = float(w.efficacy), float(w.safety), float(w.cost)
 
     constraints = constraints or {}
     TOX_MAX = constraints.get("toxicity_max", None)
     COST_MAX = constraints.get("cost_max", None)
+    # Converted once here rather than on every trial
+    tox_max = float(TOX_MAX) if TOX_MAX is not None else None
+    cost_max = float(COST_MAX) if COST_MAX is not None else None
 
-    scored: List[ScoredCandidate] = []
+    # Bounded min-heap of the best candidates seen so far, worst at heap[0].
+    # Entries are (score, -toxicity, -cost, -trial_number, candidate), so the
+    # kept set and its order match sorting all trials by (-score, tox, cost).
+    keep = max(int(top_k), 1)
+    heap: List[tuple] = []
 
     # Hard constraint example (can be adjusted)
     HARD_PDI_REJECT = 0.35
 
-    def objective(trial: optuna.Trial) -> float:
-        design = _suggest_design(trial, space)
-
-        # Run simulation (replace simulate_fn with your real simulator later)
-        sim = simulate_fn(design)
-
-        # Compute proxies / scores
-        eff = float(efficacy_proxy(sim))
-        tox, drivers = toxicity_score_hybrid(design, sim)
-        tox = float(tox)
-        cost = float(cost_score_proxy(design))
-        conf = float(simple_confidence_from_rules(tox, cost))
+    def record_trial(
+        trial: optuna.Trial, design: NanoDesign, sim,
+        eff: float, tox: float, cost: float,
+    ) -> float:
+        conf = simple_confidence_from_rules(tox, cost)
 
         # Defaults
         rejected = False
@@ -107,64 +171,112 @@ def run_optimization(
             reject_reason = f"pdi>{HARD_PDI_REJECT}"
 
         # --- Scenario / Policy constraints ---
-        if (not rejected) and (TOX_MAX is not None) and (tox > float(TOX_MAX)):
+        if (not rejected) and (tox_max is not None) and (tox > tox_max):
             rejected = True
             reject_reason = f"toxicity>{TOX_MAX}"
 
-        if (not rejected) and (COST_MAX is not None) and (cost > float(COST_MAX)):
+        if (not rejected) and (cost_max is not None) and (cost > cost_max):
             rejected = True
             reject_reason = f"cost>{COST_MAX}"
 
         # --- NEW: log what the AI tried (so UI can prove exploration) ---
-        trial.set_user_attr("efficacy", eff)
-        trial.set_user_attr("toxicity", tox)
-        trial.set_user_attr("cost", cost)
-        trial.set_user_attr("confidence", conf)
-        trial.set_user_attr("pdi", float(design.pdi))
-        trial.set_user_attr("drivers", (drivers or [])[:5])
-
-        trial.set_user_attr("rejected", bool(rejected))
-        if reject_reason:
-            trial.set_user_attr("reject_reason", str(reject_reason))
-
-        # Keep a full scored candidate list for later display
-        cand = ScoredCandidate(
-            design=design,
-            sim=sim,
-            efficacy=eff,
-            toxicity=tox,
-            cost=cost,
-            confidence=conf,
-            drivers=drivers,
-        )
-        scored.append(cand)
+        if record_attrs:
+            attrs = {
+                "efficacy": eff,
+                "toxicity": tox,
+                "cost": cost,
+                "confidence": conf,
+                "pdi": design.pdi,
+                "rejected": rejected,
+            }
+            if reject_reason:
+                attrs["reject_reason"] = reject_reason
+            for key, value in attrs.items():
+                trial.set_user_attr(key, value)
+
+        # Scalarized score (Optuna maximizes); also ranks the kept candidates
+        score = scalarized_score(eff, tox, cost, w_eff, w_safe, w_cost)
+
+        # Keep a scored candidate only while it ranks among the best `keep`
+        rank_key = (score, -tox, -cost, -trial.number)
+        if len(heap) < keep or rank_key > heap[0][:4]:
+            cand = ScoredCandidate(
+                design=design,
+                sim=sim,
+                efficacy=eff,
+                toxicity=tox,
+                cost=cost,
+                confidence=conf,
+            )
+            entry = (*rank_key, cand)
+            if len(heap) < keep:
+                heapq.heappush(heap, entry)
+            else:
+                heapq.heapreplace(heap, entry)
 
         # Reject = return very low value
         if rejected:
             return -1e9
+        return score
 
-        # Scalarized score (Optuna maximizes)
-        return float(
-            scalarized_score(
-                efficacy=eff,
-                toxicity=tox,
-                cost=cost,
-                w_eff=w.efficacy,
-                w_safe=w.safety,
-                w_cost=w.cost,
-            )
-        )
+    suggest_design = _design_sampler(space)
 
-    sampler = optuna.samplers.TPESampler(seed=seed)
-    study = optuna.create_study(direction="maximize", sampler=sampler)
-    study.optimize(objective, n_trials=int(n_trials))
+    def objective(trial: optuna.Trial) -> float:
+        design = suggest_design(trial)
 
-    # Rank candidates by the same scalarization used in the objective
-    def scalar(c: ScoredCandidate) -> float:
-        return float((w.efficacy * c.efficacy) - (w.safety * c.toxicity) - (w.cost * c.cost))
+        # Run simulation (replace simulate_fn with your real simulator later)
+        sim = simulate_fn(design)
 
-    # Filter out clearly rejected candidates (extremely low scores), but keep best list robustly
-    scored.sort(key=lambda c: (-scalar(c), c.toxicity, c.cost))
+        # Compute proxies / scores (the scoring kernels return plain floats)
+        eff = efficacy_proxy(sim)
+        tox, _ = toxicity_score_hybrid(design, sim, with_drivers=False)
+        cost = cost_score_proxy(design)
+        return record_trial(trial, design, sim, eff, tox, cost)
+
+    if batch_size <= 1:
+        sampler = optuna.samplers.TPESampler(seed=seed)
+    else:
+        # Batches keep several trials running at once: constant_liar makes TPE
+        # treat them as pessimistic results so a batch is not sampled around
+        # the same point, and the joint (multivariate, grouped) model lets the
+        # correlated size/zeta/dose parameters be sampled together.
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", optuna.exceptions.ExperimentalWarning)
+            sampler = optuna.samplers.TPESampler(
+                seed=seed, constant_liar=True, multivariate=True, group=True
+            )
+    study = optuna.create_study(direction="maximize", sampler=sampler)
+    if batch_size <= 1:
+        study.optimize(objective, n_trials=int(n_trials))
+    else:
+        simulate_batch = getattr(simulate_fn, "batch", None)
+        remaining = int(n_trials)
+        while remaining > 0:
+            trials = [study.ask() for _ in range(min(int(batch_size), remaining))]
+            remaining -= len(trials)
+            designs = [suggest_design(t) for t in trials]
+            if simulate_batch is not None:
+                sims = simulate_batch(designs)
+            else:
+                sims = [simulate_fn(d) for d in designs]
+            # Score the whole batch in NumPy, then record/tell each trial
+            effs, toxs, costs = batch_score(designs, sims)
+            for trial, design, sim, eff, tox, cost in zip(
+                trials, designs, sims, effs.tolist(), toxs.tolist(), costs.tolist()
+            ):
+                study.tell(trial, record_trial(trial, design, sim, eff, tox, cost))
+
+    # Rank kept candidates by the same scalarization used in the objective
+    # (rejected ones included, so the best list stays robust). Heap entries
+    # carry their precomputed rank key and are unique by trial number, so a
+    # plain tuple sort orders them without a key function.
+    scored = [entry[-1] for entry in sorted(heap, reverse=True)]
 
     best = scored[0]
-    return OptimizationResult(candidates=scored[: int(top_k)], best=best, study=study)
+    kept = scored[: int(top_k)]
+
+    # Driver strings are built only for the candidates that are returned
+    for c in kept or [best]:
+        c.drivers = toxicity_drivers(c.design)
+
+    return OptimizationResult(candidates=kept, best=best, study=study)
@@ -1,4 +1,6 @@
+from bisect import bisect_left, bisect_right
 from typing import List
+
 from nanobio_studio.core.types import ScoredCandidate
 
 def is_dominated(a: ScoredCandidate, b: ScoredCandidate) -> bool:
@@ -14,11 +16,46 @@ def is_dominated(a: ScoredCandidate, b: ScoredCandidate) -> bool:
     return bool(better_or_equal and strictly_better)
 
 def pareto_front(cands: List[ScoredCandidate]) -> List[ScoredCandidate]:
+    """
+    Non-dominated candidates, sorted high efficacy first, then low toxicity,
+    then low cost.
+
+    Sort-sweep instead of comparing every pair: once sorted by
+    (-efficacy, toxicity, cost), only earlier candidates can dominate a later
+    one, so each candidate is checked against a 2-D (toxicity, cost)
+    staircase of the accepted points with a binary search.
+    """
+    if len(cands) <= 1:
+        return list(cands)
+
+    ordered = sorted(cands, key=lambda x: (-x.efficacy, x.toxicity, x.cost))
+
     front = []
-    for a in cands:
-        dominated = any(is_dominated(a, b) for b in cands if b is not a)
-        if not dominated:
-            front.append(a)
-    # sort: high efficacy first, then low toxicity, then low cost
-    front.sort(key=lambda x: (-x.efficacy, x.toxicity, x.cost))
+    stair_tox: List[float] = []   # ascending toxicity ...
+    stair_cost: List[float] = []  # ... with strictly descending cost
+    prev_key = None
+    prev_kept = False
+    for c in ordered:
+        key = (c.efficacy, c.toxicity, c.cost)
+        if key == prev_key:
+            # identical scores never dominate each other: same verdict as the twin
+            if prev_kept:
+                front.append(c)
+            continue
+        prev_key = key
+
+        # any earlier, non-identical point with tox <= c.tox and cost <= c.cost dominates c
+        i = bisect_right(stair_tox, c.toxicity) - 1
+        prev_kept = i < 0 or stair_cost[i] > c.cost
+        if not prev_kept:
+            continue
+        front.append(c)
+
+        # add (tox, cost) to the staircase, dropping the points it now covers
+        j = bisect_left(stair_tox, c.toxicity)
+        k = j
+        while k < len(stair_tox) and stair_cost[k] >= c.cost:
+            k += 1
+        stair_tox[j:k] = [c.toxicity]
+        stair_cost[j:k] = [c.cost]
     return front
@@ -1,23 +1,44 @@
-from typing import List
+from operator import attrgetter
+from typing import Any, Dict, List, Optional, Sequence
+import numpy as np
 import pandas as pd
 from nanobio_studio.core.types import ScoredCandidate
 
-def candidates_to_df(cands: List[ScoredCandidate]) -> pd.DataFrame:
-    rows = []
-    for i, c in enumerate(cands, start=1):
-        rows.append({
-            "Rank": i,
-            "Size (nm)": c.design.size_nm,
-            "Zeta (mV)": c.design.zeta_mV,
-            "Material": c.design.material,
-            "Ligand": c.design.ligand,
-            "Payload": c.design.payload,
-            "Dose (mg/kg)": c.design.dose_mg_per_kg,
-            "PDI": c.design.pdi,
-            "Efficacy": c.efficacy,
-            "Toxicity (0-100)": c.toxicity,
-            "Cost (0-100)": c.cost,
-            "Confidence (0-1)": c.confidence,
-            "Top Drivers": "; ".join(c.drivers[:3]),
-        })
-    return pd.DataFrame(rows)
+_DESIGN_FLOATS = (
+    ("Size (nm)", attrgetter("size_nm")),
+    ("Zeta (mV)", attrgetter("zeta_mV")),
+    ("Dose (mg/kg)", attrgetter("dose_mg_per_kg")),
+    ("PDI", attrgetter("pdi")),
+)
+_SCORE_FLOATS = (
+    ("Efficacy", attrgetter("efficacy")),
+    ("Toxicity (0-100)", attrgetter("toxicity")),
+    ("Cost (0-100)", attrgetter("cost")),
+    ("Confidence (0-1)", attrgetter("confidence")),
+)
+_COLUMN_ORDER = (
+    "Rank", "Size (nm)", "Zeta (mV)", "Material", "Ligand", "Payload", "Dose (mg/kg)", "PDI",
+    "Efficacy", "Toxicity (0-100)", "Cost (0-100)", "Confidence (0-1)", "Top Drivers",
+)
+
+def candidate_columns(cands: List[ScoredCandidate]) -> Dict[str, Sequence[Any]]:
+    """Report columns for all candidates; numeric columns are float64 arrays."""
+    n = len(cands)
+    designs = [c.design for c in cands]
+    cols: Dict[str, Sequence[Any]] = {"Rank": np.arange(1, n + 1)}
+    for name, get in _DESIGN_FLOATS:
+        cols[name] = np.fromiter(map(get, designs), dtype=np.float64, count=n)
+    for name, get in _SCORE_FLOATS:
+        cols[name] = np.fromiter(map(get, cands), dtype=np.float64, count=n)
+    cols["Material"] = [d.material for d in designs]
+    cols["Ligand"] = [d.ligand for d in designs]
+    cols["Payload"] = [d.payload for d in designs]
+    cols["Top Drivers"] = ["; ".join(c.drivers[:3]) for c in cands]
+    return {name: cols[name] for name in _COLUMN_ORDER}
+
+def candidates_to_df(
+    cands: List[ScoredCandidate],
+    columns: Optional[Dict[str, Sequence[Any]]] = None,
+) -> pd.DataFrame:
+    """Candidate table; pass precomputed candidate_columns() to skip the walk."""
+    return pd.DataFrame(columns if columns is not None else candidate_columns(cands))
@@ -20,7 +20,8 @@ Each scenario includes:
 """
 
 from dataclasses import dataclass
-from typing import Dict, Optional, Tuple
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
 
 from nanobio_studio.ai_engine.schema import ObjectiveWeights
 
@@ -67,7 +68,7 @@ def validate_scenario(scenario: ScenarioPreset) -> Tuple[bool, str]:
         Tuple of (is_valid, error_message)
     """
     # Check weights
-    w = scenario.weights.normalized()
+    w = scenario.weights.normalized()  # memoized on the (shared) preset weights
     total = w.efficacy + w.safety + w.cost
     if abs(total - 1.0) > 0.01:
         return False, f"Weights don't sum to 1.0: {total}"
@@ -91,19 +92,8 @@ def validate_scenario(scenario: ScenarioPreset) -> Tuple[bool, str]:
     return True, ""
 
 
-def get_scenarios() -> Dict[str, ScenarioPreset]:
-    """
-    Get all available optimization scenarios
-    
-    Returns:
-        Dictionary mapping scenario keys to ScenarioPreset objects
-        
-    Scenario Reference:
-        - "academic": Balanced learning (education/research)
-        - "safety_first": Prioritize safety (translational/regulatory)
-        - "cost_constrained": Minimize cost (manufacturing/scale-up)
-        - "efficacy_driven": Maximize efficacy (early research)
-    """
+def _build_scenarios() -> Dict[str, ScenarioPreset]:
+    """Construct the scenario presets (called once, at import)."""
     return {
         "academic": ScenarioPreset(
             key="academic",
@@ -199,6 +189,28 @@ def get_scenarios() -> Dict[str, ScenarioPreset]:
     }
 
 
+# Presets are constant: built once and shared read-only by every caller
+_SCENARIOS: Mapping[str, ScenarioPreset] = MappingProxyType(_build_scenarios())
+_SCENARIO_KEYS: Tuple[str, ...] = tuple(_SCENARIOS)
+
+
+def get_scenarios() -> Mapping[str, ScenarioPreset]:
+    """
+    Get all available optimization scenarios
+    
+    Returns:
+        Read-only mapping of scenario keys to ScenarioPreset objects
+        (shared across calls; treat the presets as read-only too)
+        
+    Scenario Reference:
+        - "academic": Balanced learning (education/research)
+        - "safety_first": Prioritize safety (translational/regulatory)
+        - "cost_constrained": Minimize cost (manufacturing/scale-up)
+        - "efficacy_driven": Maximize efficacy (early research)
+    """
+    return _SCENARIOS
+
+
 def get_scenario(scenario_key: str) -> Optional[ScenarioPreset]:
     """
     Get a specific scenario by key
@@ -209,19 +221,18 @@ def get_scenario(scenario_key: str) -> Optional[ScenarioPreset]:
     Returns:
         ScenarioPreset or None if not found
     """
-    scenarios = get_scenarios()
-    return scenarios.get(scenario_key)
+    return _SCENARIOS.get(scenario_key)
 
 
 def list_scenario_keys() -> list:
     """Get list of all available scenario keys"""
-    return list(get_scenarios().keys())
+    return list(_SCENARIO_KEYS)
 
 
 def list_scenarios_summary() -> Dict[str, str]:
     """Get brief summary of all scenarios"""
     return {
         key: scenario.title
-        for key, scenario in get_scenarios().items()
+        for key, scenario in _SCENARIOS.items()
     }
 
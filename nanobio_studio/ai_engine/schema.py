@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import List, Dict
 
 @dataclass
@@ -17,12 +18,17 @@ class DesignSpace:
     # Optional fixed/allowed values
     fixed: Dict[str, str] = field(default_factory=dict)
 
-@dataclass
+@dataclass(frozen=True)
 class ObjectiveWeights:
     efficacy: float = 0.5
     safety: float = 0.3
     cost: float = 0.2
 
-    def normalized(self) -> "ObjectiveWeights":
+    @cached_property
+    def _normalized(self) -> "ObjectiveWeights":
+        # Computed once per instance; safe to share since both are frozen
         s = max(self.efficacy + self.safety + self.cost, 1e-9)
         return ObjectiveWeights(self.efficacy/s, self.safety/s, self.cost/s)
+
+    def normalized(self) -> "ObjectiveWeights":
+        return self._normalized
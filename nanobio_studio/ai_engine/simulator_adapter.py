@@ -2,12 +2,19 @@
 Adapter layer so you can plug your existing NanoBio Studio simulation
 without rewriting anything.
 """
-from typing import Callable
+from typing import Callable, List, Sequence
+
+import numpy as np
+
 from nanobio_studio.core.types import NanoDesign, SimulationResult
 
 # ---- YOU WILL WIRE THESE 3 in your project ----
 SimulateFn = Callable[[NanoDesign], SimulationResult]
 
+# Optional batch form: a SimulateFn may expose one as `simulate_fn.batch`,
+# which the optimizer uses to simulate a whole batch of trials at once.
+BatchSimulateFn = Callable[[Sequence[NanoDesign]], List[SimulationResult]]
+
 def simulate_design_placeholder(design: NanoDesign) -> SimulationResult:
     """
     Placeholder. Replace by calling your real PK/PD-lite simulator.
@@ -24,3 +31,30 @@ def simulate_design_placeholder(design: NanoDesign) -> SimulationResult:
         release_stability=stability,
         extra={}
     )
+
+def simulate_designs_placeholder(designs: Sequence[NanoDesign]) -> List[SimulationResult]:
+    """
+    Vectorized simulate_design_placeholder (same values, one NumPy pass per batch).
+    """
+    n = len(designs)
+    size = np.fromiter((d.size_nm for d in designs), float, n)
+    zeta = np.fromiter((d.zeta_mV for d in designs), float, n)
+    dose = np.fromiter((d.dose_mg_per_kg for d in designs), float, n)
+    pdi = np.fromiter((d.pdi for d in designs), float, n)
+
+    auc = (dose * 10.0) / (1.0 + np.abs(zeta)/25.0)
+    cmax = dose * (200.0 / np.maximum(size, 1.0))
+    t_half = 2.0 + (size / 100.0)
+    stability = np.maximum(0.0, 1.0 - pdi)
+    return [
+        SimulationResult(
+            auc_target=a,
+            cmax_target=c,
+            t_half_proxy=t,
+            release_stability=s,
+            extra={}
+        )
+        for a, c, t, s in zip(auc.tolist(), cmax.tolist(), t_half.tolist(), stability.tolist())
+    ]
+
+simulate_design_placeholder.batch = simulate_designs_placeholder
@@ -1,42 +1,98 @@
+from typing import Sequence
+
+import numpy as np
+
 from nanobio_studio.core.types import NanoDesign, SimulationResult
+from nanobio_studio.ai_engine._scoring_kernels import toxicity_kernel
+
+# Material priors (simple)
+_MATERIAL_PRIOR = {"Gold": 10, "Lipid": 5, "PLGA": 3}
+_MATERIAL_PRIOR_DEFAULT = 5
 
-def toxicity_score_hybrid(design: NanoDesign, sim: SimulationResult) -> tuple[float, list[str]]:
+# Lookup table for the batch path: known materials by index, default last
+_MATERIAL_INDEX = {m: i for i, m in enumerate(_MATERIAL_PRIOR)}
+_MATERIAL_PRIOR_LUT = np.array([*_MATERIAL_PRIOR.values(), _MATERIAL_PRIOR_DEFAULT], dtype=float)
+
+def toxicity_score_hybrid(
+    design: NanoDesign, sim: SimulationResult, with_drivers: bool = True
+) -> tuple[float, list[str]]:
     """
     Phase-1: Transparent hybrid toxicity score (0..100).
     Return score + top driver strings (for explainability).
+    with_drivers=False skips the driver strings (returns an empty list).
     Replace/extend later with ML model.
     """
+    # Score (clamped 0..100) from the numeric kernel; drivers use the same thresholds
+    score = toxicity_kernel(
+        float(design.size_nm),
+        float(design.zeta_mV),
+        float(design.dose_mg_per_kg),
+        float(design.pdi),
+        float(_MATERIAL_PRIOR.get(design.material, _MATERIAL_PRIOR_DEFAULT)),
+    )
+    return score, toxicity_drivers(design) if with_drivers else []
+
+def toxicity_score_batch(
+    size_nm: Sequence[float],
+    zeta_mV: Sequence[float],
+    dose_mg_per_kg: Sequence[float],
+    pdi: Sequence[float],
+    materials: Sequence[str],
+) -> np.ndarray:
+    """
+    Vectorized toxicity score over parallel arrays (one entry per design).
+    Each if/elif bin of toxicity_kernel becomes a boolean mask; same values.
+    """
+    size = np.asarray(size_nm, dtype=float)
+    abs_z = np.abs(np.asarray(zeta_mV, dtype=float))
+    dose = np.asarray(dose_mg_per_kg, dtype=float)
+    pdi = np.asarray(pdi, dtype=float)
+    n_known = len(_MATERIAL_INDEX)
+    material_idx = np.fromiter((_MATERIAL_INDEX.get(m, n_known) for m in materials), np.intp, len(materials))
+
+    score = 20.0 * (size < 50) + 10.0 * (size > 180)
+    score += 25.0 * (abs_z > 25) + 10.0 * ((abs_z > 15) & (abs_z <= 25))
+    score += 20.0 * (dose > 10) + 10.0 * ((dose > 5) & (dose <= 10))
+    score += 20.0 * (pdi > 0.25) + 10.0 * ((pdi > 0.2) & (pdi <= 0.25))
+    score += np.take(_MATERIAL_PRIOR_LUT, material_idx)
+    return np.clip(score, 0.0, 100.0, out=score)
+
+def toxicity_scores(designs: Sequence[NanoDesign]) -> np.ndarray:
+    """toxicity_score_batch for a list of NanoDesign objects."""
+    return toxicity_score_batch(
+        [d.size_nm for d in designs],
+        [d.zeta_mV for d in designs],
+        [d.dose_mg_per_kg for d in designs],
+        [d.pdi for d in designs],
+        [d.material for d in designs],
+    )
+
+def toxicity_drivers(design: NanoDesign) -> list[str]:
+    """Human-readable toxicity drivers, matching the bins scored by toxicity_kernel."""
     drivers = []
-    score = 0.0
 
     # Size risk (very small can increase cellular uptake & toxicity)
     if design.size_nm < 50:
-        score += 20; drivers.append("Small size (<50nm)")
+        drivers.append("Small size (<50nm)")
     elif design.size_nm > 180:
-        score += 10; drivers.append("Large size (>180nm)")
+        drivers.append("Large size (>180nm)")
 
     # Charge risk (high magnitude can disrupt membranes)
     if abs(design.zeta_mV) > 25:
-        score += 25; drivers.append("High |zeta| (>25mV)")
+        drivers.append("High |zeta| (>25mV)")
     elif abs(design.zeta_mV) > 15:
-        score += 10; drivers.append("Moderate |zeta| (>15mV)")
+        drivers.append("Moderate |zeta| (>15mV)")
 
     # Dose risk
     if design.dose_mg_per_kg > 10:
-        score += 20; drivers.append("High dose (>10 mg/kg)")
+        drivers.append("High dose (>10 mg/kg)")
     elif design.dose_mg_per_kg > 5:
-        score += 10; drivers.append("Moderate dose (>5 mg/kg)")
+        drivers.append("Moderate dose (>5 mg/kg)")
 
     # PDI / aggregation proxy
     if design.pdi > 0.25:
-        score += 20; drivers.append("High PDI (>0.25)")
+        drivers.append("High PDI (>0.25)")
     elif design.pdi > 0.2:
-        score += 10; drivers.append("Moderate PDI (>0.20)")
-
-    # Material priors (simple)
-    material_priors = {"Gold": 10, "Lipid": 5, "PLGA": 3}
-    score += material_priors.get(design.material, 5)
+        drivers.append("Moderate PDI (>0.20)")
 
-    # Clamp 0..100
-    score = max(0.0, min(100.0, score))
-    return score, drivers
+    return drivers
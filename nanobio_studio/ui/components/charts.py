@@ -1,21 +1,78 @@
-import plotly.express as px
-import pandas as pd
+from operator import attrgetter
+
+import numpy as np
+import streamlit as st
 from nanobio_studio.core.types import ScoredCandidate
 
+# Cached figures kept per session process (one per distinct candidate set)
+_CHART_CACHE_ENTRIES = 32
+
+_SCORE_GETTERS = {
+    "efficacy": attrgetter("efficacy"),
+    "toxicity": attrgetter("toxicity"),
+    "cost": attrgetter("cost"),
+    "confidence": attrgetter("confidence"),
+}
+
+def _candidate_key(c: ScoredCandidate) -> tuple:
+    """Content key of a candidate, stable across copies (unlike id())."""
+    d = c.design
+    return (d.material, d.ligand, d.size_nm, c.efficacy, c.toxicity)
+
 def pareto_scatter(all_cands: list[ScoredCandidate], pareto: list[ScoredCandidate]):
-    rows = []
-    pareto_ids = set(id(x) for x in pareto)
-
-    for c in all_cands:
-        rows.append({
-            "efficacy": c.efficacy,
-            "toxicity": c.toxicity,
-            "cost": c.cost,
-            "confidence": c.confidence,
-            "pareto": "Pareto" if id(c) in pareto_ids else "All",
-            "label": f"{c.design.material}/{c.design.ligand} size={c.design.size_nm:.0f}"
-        })
-    df = pd.DataFrame(rows)
+    n = len(all_cands)
+
+    # Column arrays (one per field) instead of one dict per candidate
+    cols = {
+        name: np.fromiter(map(get, all_cands), dtype=np.float64, count=n)
+        for name, get in _SCORE_GETTERS.items()
+    }
+    designs = [c.design for c in all_cands]
+    cols["size_nm"] = np.fromiter((d.size_nm for d in designs), dtype=np.float64, count=n)
+    cols["material"] = tuple(d.material for d in designs)
+    cols["ligand"] = tuple(d.ligand for d in designs)
+    # Sorted so equal Pareto sets always hash to the same cache key
+    cols["pareto_keys"] = tuple(sorted(set(map(_candidate_key, pareto))))
+    # The column values are the cache key: reruns with unchanged candidates reuse the figure
+    return _scatter_figure(**cols)
+
+
+@st.cache_data(ttl=600, max_entries=_CHART_CACHE_ENTRIES, show_spinner=False)
+def _scatter_figure(
+    efficacy: np.ndarray,
+    toxicity: np.ndarray,
+    cost: np.ndarray,
+    confidence: np.ndarray,
+    size_nm: np.ndarray,
+    material: tuple,
+    ligand: tuple,
+    pareto_keys: tuple,
+):
+    # Imported on first render (then served from sys.modules), so pages that
+    # only import this module do not pay for loading plotly
+    import pandas as pd
+    import plotly.express as px
+
+    df = pd.DataFrame({
+        "efficacy": efficacy,
+        "toxicity": toxicity,
+        "cost": cost,
+        "confidence": confidence,
+    })
+    # Pareto membership by content key; the key fields are all columns here
+    members = frozenset(pareto_keys)
+    keys = zip(material, ligand, size_nm.tolist(), efficacy.tolist(), toxicity.tolist())
+    is_pareto = np.fromiter((k in members for k in keys), dtype=bool, count=len(material))
+    df["pareto"] = np.where(is_pareto, "Pareto", "All")
+    # Smaller figure payload: cost only drives the color scale and confidence
+    # is a hover value, so neither needs float64 precision
+    df["cost"] = df["cost"].astype(np.float32)
+    df["confidence"] = df["confidence"].round(3).astype(np.float32)
+    # Hover label "<material>/<ligand> size=<nm>", built column-wise
+    size_txt = pd.Series(size_nm).round(0).astype(np.int64).astype(str)
+    df["label"] = (
+        pd.Series(material, dtype=str) + "/" + pd.Series(ligand, dtype=str) + " size=" + size_txt
+    )
 
     fig = px.scatter(
         df, x="toxicity", y="efficacy",
@@ -18,8 +18,11 @@ from __future__ import annotations
 
 import re
 import time
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple, Union
+from dataclasses import dataclass, field
+from itertools import chain
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Union
 
 import streamlit as st
 
@@ -37,8 +40,7 @@ st.set_page_config(
 # =========================
 # Lightweight Styling
 # =========================
-st.markdown(
-    """
+_CSS = """
 <style>
 /* Keep it clean, university-friendly */
 .nb-title {
@@ -129,9 +131,10 @@ st.markdown(
     border-radius: 10px;
 }
 </style>
-""",
-    unsafe_allow_html=True,
-)
+"""
+# Injected on every run: Streamlit drops elements a rerun does not emit again,
+# so gating this on a session flag would unstyle the page after the first rerun.
+st.markdown(_CSS, unsafe_allow_html=True)
 
 
 # =========================
@@ -147,6 +150,33 @@ class QuizQuestion:
     accepted_answers: Optional[List[str]] = None  # for short
     explanation: str = ""
     points: int = 1
+    # short answers: all accepted answers as one anchored alternation
+    _accept_re: Optional[re.Pattern] = field(default=None, init=False, repr=False, compare=False)
+    # mcq/tf: radio option indices and their labels, built once per question
+    _option_indices: Tuple[int, ...] = field(default=(), init=False, repr=False, compare=False)
+    _format_func: Optional[Callable[[int], str]] = field(default=None, init=False, repr=False, compare=False)
+    # widget keys (form, input, submit button), formatted once per question
+    _form_key: str = field(default="", init=False, repr=False, compare=False)
+    _in_key: str = field(default="", init=False, repr=False, compare=False)
+    _btn_key: str = field(default="", init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._form_key = f"tut_form_{self.qid}"
+        self._in_key = f"tut_in_{self.qid}"
+        self._btn_key = f"tut_btn_{self.qid}"
+        if self.qtype == "short" and self.accepted_answers:
+            self._accept_re = _accepted_pattern(tuple(self.accepted_answers))
+        if self.options is not None:
+            self._option_indices = tuple(range(len(self.options)))
+            self._format_func = self.options.__getitem__
+
+
+@dataclass(slots=True)
+class AnswerRecord:
+    """Locked submission of one question, kept in session_state["tut_answered"]."""
+    correct: bool
+    timestamp: float
+    points: int
 
 
 # =========================
@@ -156,12 +186,16 @@ def _init_state() -> None:
     """
     Initialize all session_state keys used by this tutorial page.
     Prevents KeyErrors and supports reset logic.
+    Runs once per session; later reruns return on the sentinel key.
     """
+    if st.session_state.get("_tut_init_done"):
+        return
+
     defaults = {
         # scoring
         "tut_total_points": 0,
         "tut_earned_points": 0,
-        "tut_answered": {},  # qid -> {"correct": bool, "timestamp": float, "points": int}
+        "tut_answered": {},  # qid -> AnswerRecord
         "tut_submissions": {},  # qid -> raw submission value
         "tut_last_reset": None,
         "tut_progress_notes": "",
@@ -179,6 +213,13 @@ def _init_state() -> None:
     if st.session_state["tut_course_start_ts"] is None:
         st.session_state["tut_course_start_ts"] = time.time()
 
+    st.session_state["_tut_init_done"] = True
+
+
+# Short-answer normalization patterns, compiled once
+_WS_RE = re.compile(r"[\s]+")
+_PUNCT_RE = re.compile(r"[^a-z0-9\s\-\+\/]")
+
 
 def normalize_text(s: str) -> str:
     """
@@ -190,13 +231,26 @@ def normalize_text(s: str) -> str:
     if s is None:
         return ""
     s = s.strip().lower()
-    s = re.sub(r"[\s]+", " ", s)
-    s = re.sub(r"[^a-z0-9\s\-\+\/]", "", s)
+    s = _WS_RE.sub(" ", s)
+    s = _PUNCT_RE.sub("", s)
     return s
 
 
-def compute_total_points(questions: List[QuizQuestion]) -> int:
-    return sum(q.points for q in questions)
+@st.cache_resource(show_spinner=False)
+def _accepted_pattern(accepted_answers: Tuple[str, ...]) -> re.Pattern:
+    """
+    One compiled regex matching any normalized accepted answer of a short question.
+    Cached across reruns (the page script itself re-executes on every rerun).
+    """
+    alternatives = "|".join(re.escape(normalize_text(x)) for x in accepted_answers)
+    return re.compile(f"(?:{alternatives})")
+
+
+_POINTS_OF = attrgetter("points")
+
+
+def compute_total_points(questions: Sequence[QuizQuestion]) -> int:
+    return sum(map(_POINTS_OF, questions))
 
 
 def mark_answered(qid: str, correct: bool, points: int, submission_value: Union[str, int]) -> None:
@@ -204,11 +258,11 @@ def mark_answered(qid: str, correct: bool, points: int, submission_value: Union[
     Record an answer as "locked" so it cannot be scored again.
     This prevents double scoring.
     """
-    st.session_state["tut_answered"][qid] = {
-        "correct": bool(correct),
-        "timestamp": time.time(),
-        "points": int(points),
-    }
+    st.session_state["tut_answered"][qid] = AnswerRecord(
+        correct=bool(correct),
+        timestamp=time.time(),
+        points=int(points),
+    )
     st.session_state["tut_submissions"][qid] = submission_value
 
 
@@ -217,9 +271,9 @@ def is_answered(qid: str) -> bool:
 
 
 def already_scored_message(qid: str) -> None:
-    meta = st.session_state["tut_answered"].get(qid, {})
-    correct = meta.get("correct", False)
-    pts = meta.get("points", 0)
+    meta = st.session_state["tut_answered"].get(qid)
+    correct = meta is not None and meta.correct
+    pts = meta.points if meta is not None else 0
     if correct:
         st.success(f"✅ Already submitted and scored. You earned {pts} point(s) here.")
     else:
@@ -237,20 +291,21 @@ def render_progress_header(total_points: int) -> None:
             '<div class="nb-subtitle">A step-by-step learning journey through manual design + AI co-design, with quizzes and scoring.</div>',
             unsafe_allow_html=True,
         )
+    # Static card HTML goes out as one markdown element per card; a markdown
+    # element cannot wrap widgets, so open/close tags in separate calls never nested anyway.
     with colB:
-        st.markdown('<div class="nb-card">', unsafe_allow_html=True)
-        st.markdown(f'<span class="nb-badge">Score</span> <b>{earned}</b> / <b>{total_points}</b>', unsafe_allow_html=True)
+        st.markdown(
+            f'<div class="nb-card"><span class="nb-badge">Score</span> <b>{earned}</b> / <b>{total_points}</b></div>',
+            unsafe_allow_html=True,
+        )
         st.progress(pct)
-        st.markdown('</div>', unsafe_allow_html=True)
     with colC:
-        st.markdown('<div class="nb-card">', unsafe_allow_html=True)
         answered_count = len(st.session_state["tut_answered"])
-        st.markdown(f'<span class="nb-badge">Answered</span> <b>{answered_count}</b>', unsafe_allow_html=True)
         st.markdown(
-            '<div class="nb-micro nb-muted">Each question can be scored once (anti double-scoring).</div>',
+            f'<div class="nb-card"><span class="nb-badge">Answered</span> <b>{answered_count}</b>'
+            '<div class="nb-micro nb-muted">Each question can be scored once (anti double-scoring).</div></div>',
             unsafe_allow_html=True,
         )
-        st.markdown('</div>', unsafe_allow_html=True)
     with colD:
         st.markdown('<div class="nb-card">', unsafe_allow_html=True)
         st.checkbox("Show answer explanations everywhere", key="tut_show_all_answers")
@@ -281,6 +336,8 @@ def section_check(section_id: str, check_key: str, label: str, help_text: str =
     """
     Per-section checklist item stored in session state.
     Useful for students to self-report completion.
+    Sections call this inside an st.form, so ticks are saved together on the
+    form's submit instead of rerunning the page per checkbox.
     """
     if section_id not in st.session_state["tut_section_checks"]:
         st.session_state["tut_section_checks"][section_id] = {}
@@ -297,23 +354,27 @@ def section_check(section_id: str, check_key: str, label: str, help_text: str =
     return bool(val)
 
 
-def render_quiz_block(title: str, questions: List[QuizQuestion]) -> None:
+def render_quiz_block(title: str, questions: Sequence[QuizQuestion]) -> None:
     """
     Render a quiz block with multiple questions. Each question is scored once.
     """
-    st.markdown('<div class="nb-card">', unsafe_allow_html=True)
-    st.markdown(f'<div class="nb-quiz-title">🧠 {title}</div>', unsafe_allow_html=True)
-    st.markdown('<div class="nb-hr"></div>', unsafe_allow_html=True)
+    st.markdown(
+        f'<div class="nb-card"><div class="nb-quiz-title">🧠 {title}</div><div class="nb-hr"></div></div>',
+        unsafe_allow_html=True,
+    )
 
     for q in questions:
         render_question(q)
 
-    st.markdown("</div>", unsafe_allow_html=True)
-
 
+@st.fragment
 def render_question(q: QuizQuestion) -> None:
     """
     Render a single question with anti-double-scoring.
+    The input sits in a per-question form, so picking an option or typing an
+    answer triggers no rerun at all. The submission reruns this fragment to
+    grade, then the whole page so the score header and the final summary pick
+    up the new points.
     """
     st.markdown(f"**{q.prompt}**")
     answered = is_answered(q.qid)
@@ -329,14 +390,15 @@ def render_question(q: QuizQuestion) -> None:
     # Not answered: allow input and submission
     if q.qtype in ("mcq", "tf"):
         assert q.options is not None and q.correct_index is not None, "MCQ/TF requires options and correct_index."
-        choice = st.radio(
-            "Choose one:",
-            options=list(range(len(q.options))),
-            format_func=lambda i: q.options[i],
-            key=f"tut_in_{q.qid}",
-            horizontal=False,
-        )
-        submit = st.button(f"Submit answer ({q.points} pt)", key=f"tut_btn_{q.qid}")
+        with st.form(key=q._form_key, border=False):
+            choice = st.radio(
+                "Choose one:",
+                options=q._option_indices,
+                format_func=q._format_func,
+                key=q._in_key,
+                horizontal=False,
+            )
+            submit = st.form_submit_button(f"Submit answer ({q.points} pt)", key=q._btn_key)
         if submit:
             correct = int(choice) == int(q.correct_index)
             earned_pts = q.points if correct else 0
@@ -355,12 +417,12 @@ def render_question(q: QuizQuestion) -> None:
 
     elif q.qtype == "short":
         assert q.accepted_answers is not None, "Short answer requires accepted_answers."
-        ans = st.text_input("Your answer:", key=f"tut_in_{q.qid}", placeholder="Type a short answer…")
-        submit = st.button(f"Submit answer ({q.points} pt)", key=f"tut_btn_{q.qid}")
+        with st.form(key=q._form_key, border=False):
+            ans = st.text_input("Your answer:", key=q._in_key, placeholder="Type a short answer…")
+            submit = st.form_submit_button(f"Submit answer ({q.points} pt)", key=q._btn_key)
         if submit:
             norm = normalize_text(ans)
-            accepted = [normalize_text(x) for x in q.accepted_answers]
-            correct = norm in accepted
+            correct = q._accept_re is not None and q._accept_re.fullmatch(norm) is not None
             earned_pts = q.points if correct else 0
             st.session_state["tut_earned_points"] += earned_pts
             mark_answered(q.qid, correct=correct, points=earned_pts, submission_value=ans)
@@ -384,338 +446,348 @@ def render_question(q: QuizQuestion) -> None:
 # =========================
 # Keep QIDs stable and unique.
 # Tip: prefix by section to prevent collisions.
-QUIZZES: Dict[str, List[QuizQuestion]] = {}
-
-# Section 0 — Orientation
-QUIZZES["S0"] = [
-    QuizQuestion(
-        qid="S0_Q1",
-        prompt="What is the main purpose of NanoBio Studio?",
-        qtype="mcq",
-        options=[
-            "To replace laboratory experiments completely",
-            "To help design and understand nanoparticle drug delivery using guided simulation + analysis",
-            "To sell pharmaceuticals directly to hospitals",
-            "To create 3D animations for biology students only",
-        ],
-        correct_index=1,
-        explanation=(
-            "NanoBio Studio is an educational + decision-support platform. It helps you explore design variables "
-            "(size, charge, ligand, payload, etc.), simulate delivery behavior, and reflect on safety/cost/protocol steps."
+@st.cache_resource(show_spinner=False)
+def _build_quiz_bank() -> Mapping[str, Tuple[QuizQuestion, ...]]:
+    """
+    The static question bank, built once per process and shared by all sessions
+    (the page script itself re-executes on every rerun). Read-only: the mapping
+    is a proxy and each section is a tuple.
+    """
+    quizzes: Dict[str, List[QuizQuestion]] = {}
+
+    # Section 0 — Orientation
+    quizzes["S0"] = [
+        QuizQuestion(
+            qid="S0_Q1",
+            prompt="What is the main purpose of NanoBio Studio?",
+            qtype="mcq",
+            options=[
+                "To replace laboratory experiments completely",
+                "To help design and understand nanoparticle drug delivery using guided simulation + analysis",
+                "To sell pharmaceuticals directly to hospitals",
+                "To create 3D animations for biology students only",
+            ],
+            correct_index=1,
+            explanation=(
+                "NanoBio Studio is an educational + decision-support platform. It helps you explore design variables "
+                "(size, charge, ligand, payload, etc.), simulate delivery behavior, and reflect on safety/cost/protocol steps."
+            ),
+            points=2,
         ),
-        points=2,
-    ),
-    QuizQuestion(
-        qid="S0_Q2",
-        prompt="True or False: In this tutorial, each quiz question can be scored multiple times until you get it right.",
-        qtype="tf",
-        options=["True", "False"],
-        correct_index=1,
-        explanation=(
-            "False. To keep scoring fair, each question is locked once submitted. "
-            "You can still read the explanation and learn, but you won't gain extra points by re-submitting."
+        QuizQuestion(
+            qid="S0_Q2",
+            prompt="True or False: In this tutorial, each quiz question can be scored multiple times until you get it right.",
+            qtype="tf",
+            options=["True", "False"],
+            correct_index=1,
+            explanation=(
+                "False. To keep scoring fair, each question is locked once submitted. "
+                "You can still read the explanation and learn, but you won't gain extra points by re-submitting."
+            ),
+            points=1,
         ),
-        points=1,
-    ),
-]
-
-# Section 1 — Materials & Targets
-QUIZZES["S1"] = [
-    QuizQuestion(
-        qid="S1_Q1",
-        prompt="Which combination best matches the idea of 'Materials & Targets'?",
-        qtype="mcq",
-        options=[
-            "Choosing a camera sensor and a lens",
-            "Choosing nanoparticle building blocks and the biological tissue/cell/receptor you want to reach",
-            "Choosing a hospital and selecting a doctor",
-            "Choosing a font and a color theme",
-        ],
-        correct_index=1,
-        explanation=(
-            "This module is where you pick nanoparticle materials (e.g., polymers, lipids, metals) "
-            "and define the biological target (e.g., tumor tissue, liver, EGFR receptor)."
+    ]
+
+    # Section 1 — Materials & Targets
+    quizzes["S1"] = [
+        QuizQuestion(
+            qid="S1_Q1",
+            prompt="Which combination best matches the idea of 'Materials & Targets'?",
+            qtype="mcq",
+            options=[
+                "Choosing a camera sensor and a lens",
+                "Choosing nanoparticle building blocks and the biological tissue/cell/receptor you want to reach",
+                "Choosing a hospital and selecting a doctor",
+                "Choosing a font and a color theme",
+            ],
+            correct_index=1,
+            explanation=(
+                "This module is where you pick nanoparticle materials (e.g., polymers, lipids, metals) "
+                "and define the biological target (e.g., tumor tissue, liver, EGFR receptor)."
+            ),
+            points=2,
         ),
-        points=2,
-    ),
-    QuizQuestion(
-        qid="S1_Q2",
-        prompt="Short answer: Name ONE common mistake when selecting a biological target.",
-        qtype="short",
-        accepted_answers=[
-            "choosing a target without a delivery pathway",
-            "choosing a target that is not reachable",
-            "picking a target without considering off target effects",
-            "not considering off target effects",
-            "not considering receptor availability",
-            "ignoring receptor expression",
-            "ignoring tissue barriers",
-        ],
-        explanation=(
-            "Common mistakes include: selecting a target with no realistic delivery route, "
-            "ignoring tissue barriers (e.g., BBB), ignoring off-target risk, or assuming the receptor is abundant."
+        QuizQuestion(
+            qid="S1_Q2",
+            prompt="Short answer: Name ONE common mistake when selecting a biological target.",
+            qtype="short",
+            accepted_answers=[
+                "choosing a target without a delivery pathway",
+                "choosing a target that is not reachable",
+                "picking a target without considering off target effects",
+                "not considering off target effects",
+                "not considering receptor availability",
+                "ignoring receptor expression",
+                "ignoring tissue barriers",
+            ],
+            explanation=(
+                "Common mistakes include: selecting a target with no realistic delivery route, "
+                "ignoring tissue barriers (e.g., BBB), ignoring off-target risk, or assuming the receptor is abundant."
+            ),
+            points=2,
         ),
-        points=2,
-    ),
-]
-
-# Section 2 — Design Nanoparticle
-QUIZZES["S2"] = [
-    QuizQuestion(
-        qid="S2_Q1",
-        prompt="In nanoparticle design, why do we care about particle size?",
-        qtype="mcq",
-        options=[
-            "Size only changes the color of the nanoparticle",
-            "Size affects circulation time, tissue penetration, clearance, and sometimes toxicity",
-            "Size only matters for microscope pictures",
-            "Size is irrelevant if you have a ligand",
-        ],
-        correct_index=1,
-        explanation=(
-            "Size influences biodistribution: too small may clear quickly (kidney filtration), "
-            "too large may get trapped (spleen/liver) and may increase immune recognition. "
-            "It also affects how particles move through tissue."
+    ]
+
+    # Section 2 — Design Nanoparticle
+    quizzes["S2"] = [
+        QuizQuestion(
+            qid="S2_Q1",
+            prompt="In nanoparticle design, why do we care about particle size?",
+            qtype="mcq",
+            options=[
+                "Size only changes the color of the nanoparticle",
+                "Size affects circulation time, tissue penetration, clearance, and sometimes toxicity",
+                "Size only matters for microscope pictures",
+                "Size is irrelevant if you have a ligand",
+            ],
+            correct_index=1,
+            explanation=(
+                "Size influences biodistribution: too small may clear quickly (kidney filtration), "
+                "too large may get trapped (spleen/liver) and may increase immune recognition. "
+                "It also affects how particles move through tissue."
+            ),
+            points=2,
         ),
-        points=2,
-    ),
-    QuizQuestion(
-        qid="S2_Q2",
-        prompt="True or False: A highly positive surface charge is always safer because cells are negatively charged.",
-        qtype="tf",
-        options=["True", "False"],
-        correct_index=1,
-        explanation=(
-            "False. While positive charge may increase uptake in some cases, it can also raise toxicity, "
-            "increase non-specific interactions, and trigger immune responses. Safety depends on balance and context."
+        QuizQuestion(
+            qid="S2_Q2",
+            prompt="True or False: A highly positive surface charge is always safer because cells are negatively charged.",
+            qtype="tf",
+            options=["True", "False"],
+            correct_index=1,
+            explanation=(
+                "False. While positive charge may increase uptake in some cases, it can also raise toxicity, "
+                "increase non-specific interactions, and trigger immune responses. Safety depends on balance and context."
+            ),
+            points=2,
         ),
-        points=2,
-    ),
-]
-
-# Section 3 — Delivery Simulation (PK/PD-lite)
-QUIZZES["S3"] = [
-    QuizQuestion(
-        qid="S3_Q1",
-        prompt="The two-compartment simulation typically separates concentration into:",
-        qtype="mcq",
-        options=[
-            "Ocean vs desert",
-            "Plasma (blood) vs tissue (target site)",
-            "Left lung vs right lung",
-            "DNA vs RNA",
-        ],
-        correct_index=1,
-        explanation=(
-            "A simple PK/PD-lite model often tracks drug (or nanoparticle payload) in plasma and in tissue. "
-            "It helps you reason about exposure over time and delivery efficiency."
+    ]
+
+    # Section 3 — Delivery Simulation (PK/PD-lite)
+    quizzes["S3"] = [
+        QuizQuestion(
+            qid="S3_Q1",
+            prompt="The two-compartment simulation typically separates concentration into:",
+            qtype="mcq",
+            options=[
+                "Ocean vs desert",
+                "Plasma (blood) vs tissue (target site)",
+                "Left lung vs right lung",
+                "DNA vs RNA",
+            ],
+            correct_index=1,
+            explanation=(
+                "A simple PK/PD-lite model often tracks drug (or nanoparticle payload) in plasma and in tissue. "
+                "It helps you reason about exposure over time and delivery efficiency."
+            ),
+            points=2,
         ),
-        points=2,
-    ),
-    QuizQuestion(
-        qid="S3_Q2",
-        prompt="Short answer: If the tissue curve stays very low while plasma stays high, what is a likely interpretation?",
-        qtype="short",
-        accepted_answers=[
-            "poor tissue uptake",
-            "low tissue uptake",
-            "weak targeting",
-            "poor targeting",
-            "delivery barrier",
-            "barrier prevents delivery",
-        ],
-        explanation=(
-            "A common interpretation is poor delivery to the target tissue (weak uptake/transport), or a barrier effect. "
-            "You may need to adjust size/ligand/release or consider a different target route."
+        QuizQuestion(
+            qid="S3_Q2",
+            prompt="Short answer: If the tissue curve stays very low while plasma stays high, what is a likely interpretation?",
+            qtype="short",
+            accepted_answers=[
+                "poor tissue uptake",
+                "low tissue uptake",
+                "weak targeting",
+                "poor targeting",
+                "delivery barrier",
+                "barrier prevents delivery",
+            ],
+            explanation=(
+                "A common interpretation is poor delivery to the target tissue (weak uptake/transport), or a barrier effect. "
+                "You may need to adjust size/ligand/release or consider a different target route."
+            ),
+            points=2,
         ),
-        points=2,
-    ),
-]
-
-# Section 4 — Toxicity & Safety
-QUIZZES["S4"] = [
-    QuizQuestion(
-        qid="S4_Q1",
-        prompt="Which factors can increase heuristic toxicity risk in nanoparticle systems?",
-        qtype="mcq",
-        options=[
-            "Only the color of the UI",
-            "High dose, extreme charge, very small size, high PDI, and poor steric stabilization",
-            "Only the brand of the computer",
-            "Whether the student is left-handed",
-        ],
-        correct_index=1,
-        explanation=(
-            "Safety scoring often uses heuristic inputs: dose, particle size, surface charge, polydispersity index (PDI), "
-            "and stabilization/stealth features. These correlate with aggregation, immune response, and off-target interactions."
+    ]
+
+    # Section 4 — Toxicity & Safety
+    quizzes["S4"] = [
+        QuizQuestion(
+            qid="S4_Q1",
+            prompt="Which factors can increase heuristic toxicity risk in nanoparticle systems?",
+            qtype="mcq",
+            options=[
+                "Only the color of the UI",
+                "High dose, extreme charge, very small size, high PDI, and poor steric stabilization",
+                "Only the brand of the computer",
+                "Whether the student is left-handed",
+            ],
+            correct_index=1,
+            explanation=(
+                "Safety scoring often uses heuristic inputs: dose, particle size, surface charge, polydispersity index (PDI), "
+                "and stabilization/stealth features. These correlate with aggregation, immune response, and off-target interactions."
+            ),
+            points=2,
         ),
-        points=2,
-    ),
-    QuizQuestion(
-        qid="S4_Q2",
-        prompt="True or False: A low PDI generally suggests a more uniform particle size distribution.",
-        qtype="tf",
-        options=["True", "False"],
-        correct_index=0,
-        explanation=(
-            "True. Lower PDI usually indicates more uniform particle sizes. Higher PDI means broader distribution, "
-            "which can cause unpredictable behavior and may increase safety concerns."
+        QuizQuestion(
+            qid="S4_Q2",
+            prompt="True or False: A low PDI generally suggests a more uniform particle size distribution.",
+            qtype="tf",
+            options=["True", "False"],
+            correct_index=0,
+            explanation=(
+                "True. Lower PDI usually indicates more uniform particle sizes. Higher PDI means broader distribution, "
+                "which can cause unpredictable behavior and may increase safety concerns."
+            ),
+            points=1,
         ),
-        points=1,
-    ),
-]
-
-# Section 5 — Cost Estimator
-QUIZZES["S5"] = [
-    QuizQuestion(
-        qid="S5_Q1",
-        prompt="What is the BEST interpretation of the cost estimator at early design stage?",
-        qtype="mcq",
-        options=[
-            "Exact manufacturing price in AED with guaranteed accuracy",
-            "A relative complexity/cost index to compare options and guide design decisions",
-            "A legal invoice generator for hospitals",
-            "A stock market predictor",
-        ],
-        correct_index=1,
-        explanation=(
-            "Early-stage design lacks full process definition. The estimator is best used for comparison: "
-            "which option is likely more complex, more costly, or harder to scale."
+    ]
+
+    # Section 5 — Cost Estimator
+    quizzes["S5"] = [
+        QuizQuestion(
+            qid="S5_Q1",
+            prompt="What is the BEST interpretation of the cost estimator at early design stage?",
+            qtype="mcq",
+            options=[
+                "Exact manufacturing price in AED with guaranteed accuracy",
+                "A relative complexity/cost index to compare options and guide design decisions",
+                "A legal invoice generator for hospitals",
+                "A stock market predictor",
+            ],
+            correct_index=1,
+            explanation=(
+                "Early-stage design lacks full process definition. The estimator is best used for comparison: "
+                "which option is likely more complex, more costly, or harder to scale."
+            ),
+            points=2,
         ),
-        points=2,
-    ),
-    QuizQuestion(
-        qid="S5_Q2",
-        prompt="Short answer: Name ONE design choice that often increases manufacturing complexity.",
-        qtype="short",
-        accepted_answers=[
-            "more steps",
-            "adding a ligand",
-            "complex ligand",
-            "rare material",
-            "tight size control",
-            "multiple components",
-            "sterile processing",
-        ],
-        explanation=(
-            "Examples: adding targeting ligands, multi-layer nanoparticles, tight size constraints, rare materials, "
-            "or steps requiring sterile/controlled environments."
+        QuizQuestion(
+            qid="S5_Q2",
+            prompt="Short answer: Name ONE design choice that often increases manufacturing complexity.",
+            qtype="short",
+            accepted_answers=[
+                "more steps",
+                "adding a ligand",
+                "complex ligand",
+                "rare material",
+                "tight size control",
+                "multiple components",
+                "sterile processing",
+            ],
+            explanation=(
+                "Examples: adding targeting ligands, multi-layer nanoparticles, tight size constraints, rare materials, "
+                "or steps requiring sterile/controlled environments."
+            ),
+            points=2,
         ),
-        points=2,
-    ),
-]
-
-# Section 6 — Protocol Generator
-QUIZZES["S6"] = [
-    QuizQuestion(
-        qid="S6_Q1",
-        prompt="Why is the Protocol Generator useful for students and early-stage labs?",
-        qtype="mcq",
-        options=[
-            "It replaces lab safety approvals",
-            "It drafts an SOP-style outline so you can plan experiments clearly and consistently",
-            "It manufactures the nanoparticles automatically",
-            "It guarantees publication acceptance",
-        ],
-        correct_index=1,
-        explanation=(
-            "A good protocol outline improves clarity, repeatability, and helps teams discuss steps before spending resources."
+    ]
+
+    # Section 6 — Protocol Generator
+    quizzes["S6"] = [
+        QuizQuestion(
+            qid="S6_Q1",
+            prompt="Why is the Protocol Generator useful for students and early-stage labs?",
+            qtype="mcq",
+            options=[
+                "It replaces lab safety approvals",
+                "It drafts an SOP-style outline so you can plan experiments clearly and consistently",
+                "It manufactures the nanoparticles automatically",
+                "It guarantees publication acceptance",
+            ],
+            correct_index=1,
+            explanation=(
+                "A good protocol outline improves clarity, repeatability, and helps teams discuss steps before spending resources."
+            ),
+            points=2,
         ),
-        points=2,
-    ),
-    QuizQuestion(
-        qid="S6_Q2",
-        prompt="True or False: A protocol outline should include controls and measurement checkpoints.",
-        qtype="tf",
-        options=["True", "False"],
-        correct_index=0,
-        explanation=(
-            "True. Controls (negative/positive) and checkpoints (size, PDI, zeta potential, release tests) "
-            "are essential for trustworthy interpretation."
+        QuizQuestion(
+            qid="S6_Q2",
+            prompt="True or False: A protocol outline should include controls and measurement checkpoints.",
+            qtype="tf",
+            options=["True", "False"],
+            correct_index=0,
+            explanation=(
+                "True. Controls (negative/positive) and checkpoints (size, PDI, zeta potential, release tests) "
+                "are essential for trustworthy interpretation."
+            ),
+            points=1,
         ),
-        points=1,
-    ),
-]
-
-# Section 7 — AI Co-Designer (Scenario/Policy Mode + Explainability + Governance)
-QUIZZES["S7"] = [
-    QuizQuestion(
-        qid="S7_Q1",
-        prompt="In Scenario/Policy Mode, the AI Co-Designer is mainly used to:",
-        qtype="mcq",
-        options=[
-            "Generate random nanoparticle designs without any constraints",
-            "Explore design choices under constraints (e.g., safety-first, cost-limited, UAE lab capability)",
-            "Rewrite student essays",
-            "Predict football match results",
-        ],
-        correct_index=1,
-        explanation=(
-            "Scenario/Policy Mode lets you state constraints and priorities. The AI proposes options and trade-offs "
-            "based on those goals (e.g., safer, cheaper, more target-specific)."
+    ]
+
+    # Section 7 — AI Co-Designer (Scenario/Policy Mode + Explainability + Governance)
+    quizzes["S7"] = [
+        QuizQuestion(
+            qid="S7_Q1",
+            prompt="In Scenario/Policy Mode, the AI Co-Designer is mainly used to:",
+            qtype="mcq",
+            options=[
+                "Generate random nanoparticle designs without any constraints",
+                "Explore design choices under constraints (e.g., safety-first, cost-limited, UAE lab capability)",
+                "Rewrite student essays",
+                "Predict football match results",
+            ],
+            correct_index=1,
+            explanation=(
+                "Scenario/Policy Mode lets you state constraints and priorities. The AI proposes options and trade-offs "
+                "based on those goals (e.g., safer, cheaper, more target-specific)."
+            ),
+            points=2,
         ),
-        points=2,
-    ),
-    QuizQuestion(
-        qid="S7_Q2",
-        prompt="True or False: Explainability and audit export are important for governance and responsible innovation.",
-        qtype="tf",
-        options=["True", "False"],
-        correct_index=0,
-        explanation=(
-            "True. Explainability helps humans understand why a recommendation was made. "
-            "Audit reports support transparency, review, and institutional alignment."
+        QuizQuestion(
+            qid="S7_Q2",
+            prompt="True or False: Explainability and audit export are important for governance and responsible innovation.",
+            qtype="tf",
+            options=["True", "False"],
+            correct_index=0,
+            explanation=(
+                "True. Explainability helps humans understand why a recommendation was made. "
+                "Audit reports support transparency, review, and institutional alignment."
+            ),
+            points=2,
         ),
-        points=2,
-    ),
-]
-
-# Section 8 — Integrated Workflow + Baseline Comparison
-QUIZZES["S8"] = [
-    QuizQuestion(
-        qid="S8_Q1",
-        prompt="What is the purpose of 'AI vs Manual Baseline'?",
-        qtype="mcq",
-        options=[
-            "To prove AI is always better",
-            "To compare two approaches and learn where each one is stronger or weaker",
-            "To remove the need for human judgment",
-            "To generate a CV for the student",
-        ],
-        correct_index=1,
-        explanation=(
-            "A baseline comparison is educational: it shows how manual reasoning and AI reasoning differ, "
-            "and why a combined approach can be more robust."
+    ]
+
+    # Section 8 — Integrated Workflow + Baseline Comparison
+    quizzes["S8"] = [
+        QuizQuestion(
+            qid="S8_Q1",
+            prompt="What is the purpose of 'AI vs Manual Baseline'?",
+            qtype="mcq",
+            options=[
+                "To prove AI is always better",
+                "To compare two approaches and learn where each one is stronger or weaker",
+                "To remove the need for human judgment",
+                "To generate a CV for the student",
+            ],
+            correct_index=1,
+            explanation=(
+                "A baseline comparison is educational: it shows how manual reasoning and AI reasoning differ, "
+                "and why a combined approach can be more robust."
+            ),
+            points=2,
         ),
-        points=2,
-    ),
-    QuizQuestion(
-        qid="S8_Q2",
-        prompt="Short answer: Name ONE reason why a manual baseline remains valuable even when AI is available.",
-        qtype="short",
-        accepted_answers=[
-            "human judgment",
-            "domain knowledge",
-            "context awareness",
-            "verification",
-            "accountability",
-            "safety review",
-            "bias checking",
-        ],
-        explanation=(
-            "Manual baselines help with verification, accountability, context, and detecting AI mistakes or hidden assumptions."
+        QuizQuestion(
+            qid="S8_Q2",
+            prompt="Short answer: Name ONE reason why a manual baseline remains valuable even when AI is available.",
+            qtype="short",
+            accepted_answers=[
+                "human judgment",
+                "domain knowledge",
+                "context awareness",
+                "verification",
+                "accountability",
+                "safety review",
+                "bias checking",
+            ],
+            explanation=(
+                "Manual baselines help with verification, accountability, context, and detecting AI mistakes or hidden assumptions."
+            ),
+            points=2,
         ),
-        points=2,
-    ),
-]
+    ]
+
+    return MappingProxyType({sid: tuple(qs) for sid, qs in quizzes.items()})
+
+
+QUIZZES: Mapping[str, Tuple[QuizQuestion, ...]] = _build_quiz_bank()
 
 
 # =========================
 # Total points computed once
 # =========================
-ALL_QUESTIONS: List[QuizQuestion] = []
-for _k, _qs in QUIZZES.items():
-    ALL_QUESTIONS.extend(_qs)
+ALL_QUESTIONS: Tuple[QuizQuestion, ...] = tuple(chain.from_iterable(QUIZZES.values()))
 TOTAL_POINTS = compute_total_points(ALL_QUESTIONS)
 
 
@@ -791,19 +863,19 @@ st.markdown("")
 # ======================================================================
 # SECTION 0 — Orientation (What you are building & why it matters)
 # ======================================================================
-with st.expander("0) Orientation — What NanoBio Studio is (and is NOT) ✅", expanded=True):
-    st.markdown(
-        """
+# Sections are stateful expanders (on_change="rerun"): a collapsed section
+# skips its body, so its markdown, checklists and quiz widgets are not
+# rebuilt or sent on every rerun. Opening one reruns the page to render it.
+_exp_s0 = st.expander("0) Orientation — What NanoBio Studio is (and is NOT) ✅", expanded=True, key="tut_exp_s0", on_change="rerun")
+if _exp_s0.open:
+    with _exp_s0:
+        st.markdown(
+            """
 <div class="nb-note">
 <b>Learning outcome:</b> By the end of this section, you can explain NanoBio Studio in one paragraph to a classmate:
 what it does, why it exists, and what it does <i>not</i> claim to do.
 </div>
-""",
-        unsafe_allow_html=True,
-    )
 
-    st.markdown(
-        """
 ### What NanoBio Studio does (in student language)
 
 NanoBio Studio helps you **think like a nanoparticle designer**. In real research, nanoparticle drug delivery is full of
@@ -836,55 +908,47 @@ Treat your outputs as:
 - **Justifications** (why this design is reasonable given goals and constraints)
 
 Not as absolute truth.
-"""
-    )
 
-    st.markdown(
-        """
 <div class="nb-callout-warn">
 <b>Common student mistake:</b> Treating the simulator outputs as “final answers”.  
 ✅ Better: use outputs to ask better questions, then refine the design.
 </div>
-""",
-        unsafe_allow_html=True,
-    )
 
-    st.markdown("### Mini exercise (2 minutes)")
-    st.markdown(
-        """
+### Mini exercise (2 minutes)
+
 Write a short explanation (2–3 sentences) as if you are speaking to a supervisor:
 
 - What problem does NanoBio Studio help with?
 - What is one key benefit for students?
 
 You can write it in your notebook or in the “Your notes” box at the top.
-"""
-    )
 
-    st.markdown("### Quick checklist")
-    section_check("S0", "chk_1", "I understand what NanoBio Studio does (supportive simulation + analysis).")
-    section_check("S0", "chk_2", "I understand what NanoBio Studio does NOT claim (not a replacement for lab validation).")
-    section_check("S0", "chk_3", "I will treat results as hypothesis + comparison, not absolute truth.")
+### Quick checklist
+""",
+            unsafe_allow_html=True,
+        )
+        with st.form(key="tut_form_chk_s0", border=False):
+            section_check("S0", "chk_1", "I understand what NanoBio Studio does (supportive simulation + analysis).")
+            section_check("S0", "chk_2", "I understand what NanoBio Studio does NOT claim (not a replacement for lab validation).")
+            section_check("S0", "chk_3", "I will treat results as hypothesis + comparison, not absolute truth.")
+            st.form_submit_button("Save checklist", key="tut_btn_chk_s0")
 
-    render_quiz_block("Orientation Quiz (Section 0)", QUIZZES["S0"])
+        render_quiz_block("Orientation Quiz (Section 0)", QUIZZES["S0"])
 
 
 # ======================================================================
 # SECTION 1 — Materials & Targets
 # ======================================================================
-with st.expander("1) Materials & Targets — Choosing the building blocks and the destination 🧩", expanded=False):
-    st.markdown(
-        """
+_exp_s1 = st.expander("1) Materials & Targets — Choosing the building blocks and the destination 🧩", expanded=False, key="tut_exp_s1", on_change="rerun")
+if _exp_s1.open:
+    with _exp_s1:
+        st.markdown(
+            """
 <div class="nb-note">
 <b>Learning outcome:</b> You can select a nanoparticle material and a biological target in a way that makes biological sense.
 You also know what information you must not ignore (barriers, off-target risk, feasibility).
 </div>
-""",
-        unsafe_allow_html=True,
-    )
 
-    st.markdown(
-        """
 ### Why this module exists
 Before you adjust numbers (size, charge, etc.), you need clarity on two basics:
 
@@ -925,27 +989,26 @@ Create a target statement like:
 
 Example:
 - “We aim to deliver a small-molecule payload to tumor tissue using a lipid nanoparticle, because lipid carriers are common and can support controlled release.”
-"""
-    )
 
-    st.markdown(
-        """
 <div class="nb-callout-good">
 <b>Practical UAE-university tip:</b> When working on projects, always write a 1–2 line “design intent” that your instructor can review quickly.
 It improves grading clarity and reduces confusion in teamwork.
 </div>
+
+### Checkpoints
 """,
-        unsafe_allow_html=True,
-    )
+            unsafe_allow_html=True,
+        )
+        with st.form(key="tut_form_chk_s1", border=False):
+            section_check("S1", "chk_1", "I selected one material and one target (not too many at once).")
+            section_check("S1", "chk_2", "I can describe the delivery route in one sentence.")
+            section_check("S1", "chk_3", "I considered at least one barrier or off-target risk.")
+            st.form_submit_button("Save checklist", key="tut_btn_chk_s1")
 
-    st.markdown("### Checkpoints")
-    section_check("S1", "chk_1", "I selected one material and one target (not too many at once).")
-    section_check("S1", "chk_2", "I can describe the delivery route in one sentence.")
-    section_check("S1", "chk_3", "I considered at least one barrier or off-target risk.")
+        st.markdown(
+            """
+### Mini practice (optional)
 
-    st.markdown("### Mini practice (optional)")
-    st.markdown(
-        """
 Try this: pick one target and list **two obstacles** to reaching it.
 
 Examples of obstacles:
@@ -954,28 +1017,25 @@ Examples of obstacles:
 - poor tissue penetration
 - receptor scarcity
 - instability in blood
-"""
-    )
+""",
+        )
 
-    render_quiz_block("Materials & Targets Quiz (Section 1)", QUIZZES["S1"])
+        render_quiz_block("Materials & Targets Quiz (Section 1)", QUIZZES["S1"])
 
 
 # ======================================================================
 # SECTION 2 — Design Nanoparticle
 # ======================================================================
-with st.expander("2) Design Nanoparticle — Turning an idea into a controlled concept 🧪", expanded=False):
-    st.markdown(
-        """
+_exp_s2 = st.expander("2) Design Nanoparticle — Turning an idea into a controlled concept 🧪", expanded=False, key="tut_exp_s2", on_change="rerun")
+if _exp_s2.open:
+    with _exp_s2:
+        st.markdown(
+            """
 <div class="nb-note">
 <b>Learning outcome:</b> You can adjust key nanoparticle parameters and explain how each parameter changes behavior and risk.
 You also know how to avoid “random tuning”.
 </div>
-""",
-        unsafe_allow_html=True,
-    )
 
-    st.markdown(
-        """
 ### Why this module exists
 This is where NanoBio Studio becomes a real learning tool:
 you will adjust controllable parameters and see how choices influence simulation, safety, and cost.
@@ -1028,52 +1088,48 @@ Ligand helps targeting but does not guarantee success. It can also increase immu
 3) Predict what will happen before you simulate:
    - “If I make it smaller, I expect …”
    - “If I add ligand, I expect …”
-"""
-    )
 
-    st.markdown(
-        """
 <div class="nb-callout-warn">
 <b>Important:</b> A “good design” is not the most complex design.
 A good design is a balanced one that matches a goal and can be justified.
 </div>
+
+### Checkpoints
 """,
-        unsafe_allow_html=True,
-    )
+            unsafe_allow_html=True,
+        )
+        with st.form(key="tut_form_chk_s2", border=False):
+            section_check("S2", "chk_1", "I created a baseline design with moderate parameters.")
+            section_check("S2", "chk_2", "I changed only one key parameter to see its effect.")
+            section_check("S2", "chk_3", "I wrote a short prediction before simulating (what I expect to happen).")
+            st.form_submit_button("Save checklist", key="tut_btn_chk_s2")
 
-    st.markdown("### Checkpoints")
-    section_check("S2", "chk_1", "I created a baseline design with moderate parameters.")
-    section_check("S2", "chk_2", "I changed only one key parameter to see its effect.")
-    section_check("S2", "chk_3", "I wrote a short prediction before simulating (what I expect to happen).")
+        st.markdown(
+            """
+### Practical examples (non-technical)
 
-    st.markdown("### Practical examples (non-technical)")
-    st.markdown(
-        """
 - **Safety-first student design:** moderate size, mild charge, minimal ligand complexity.
 - **Targeting-first design:** add ligand, but keep charge mild and dose controlled.
 - **Cost-limited design:** avoid rare materials, avoid too many synthesis steps.
-"""
-    )
+""",
+        )
 
-    render_quiz_block("Design Nanoparticle Quiz (Section 2)", QUIZZES["S2"])
+        render_quiz_block("Design Nanoparticle Quiz (Section 2)", QUIZZES["S2"])
 
 
 # ======================================================================
 # SECTION 3 — Delivery Simulation (PK/PD-lite)
 # ======================================================================
-with st.expander("3) Delivery Simulation (PK/PD-lite) — Reading curves like a scientist 📈", expanded=False):
-    st.markdown(
-        """
+_exp_s3 = st.expander("3) Delivery Simulation (PK/PD-lite) — Reading curves like a scientist 📈", expanded=False, key="tut_exp_s3", on_change="rerun")
+if _exp_s3.open:
+    with _exp_s3:
+        st.markdown(
+            """
 <div class="nb-note">
 <b>Learning outcome:</b> You can interpret plasma vs tissue curves, and explain what changes might improve delivery.
 You also learn how not to over-interpret a simplified model.
 </div>
-""",
-        unsafe_allow_html=True,
-    )
 
-    st.markdown(
-        """
 ### Why this module exists
 In drug delivery, **time matters**.
 Even if a payload reaches tissue, it must reach it:
@@ -1128,43 +1184,38 @@ After running two designs:
 - Which design increased plasma exposure (possible off-target)?
 Write one sentence conclusion:
 - “Design B increases tissue exposure but also increases plasma exposure; we should verify safety next.”
-"""
-    )
 
-    st.markdown(
-        """
 <div class="nb-callout-good">
 <b>Instructor-friendly tip:</b> When you submit assignments, include a screenshot of the curves and a 2–3 bullet interpretation.
 This shows understanding and earns marks.
 </div>
-""",
-        unsafe_allow_html=True,
-    )
 
-    st.markdown("### Checkpoints")
-    section_check("S3", "chk_1", "I ran the simulation for at least one design.")
-    section_check("S3", "chk_2", "I compared two designs (baseline vs modified).")
-    section_check("S3", "chk_3", "I wrote a short interpretation of plasma vs tissue curves.")
+### Checkpoints
+""",
+            unsafe_allow_html=True,
+        )
+        with st.form(key="tut_form_chk_s3", border=False):
+            section_check("S3", "chk_1", "I ran the simulation for at least one design.")
+            section_check("S3", "chk_2", "I compared two designs (baseline vs modified).")
+            section_check("S3", "chk_3", "I wrote a short interpretation of plasma vs tissue curves.")
+            st.form_submit_button("Save checklist", key="tut_btn_chk_s3")
 
-    render_quiz_block("Delivery Simulation Quiz (Section 3)", QUIZZES["S3"])
+        render_quiz_block("Delivery Simulation Quiz (Section 3)", QUIZZES["S3"])
 
 
 # ======================================================================
 # SECTION 4 — Toxicity & Safety
 # ======================================================================
-with st.expander("4) Toxicity & Safety — Thinking responsibly (and professionally) 🛡️", expanded=False):
-    st.markdown(
-        """
+_exp_s4 = st.expander("4) Toxicity & Safety — Thinking responsibly (and professionally) 🛡️", expanded=False, key="tut_exp_s4", on_change="rerun")
+if _exp_s4.open:
+    with _exp_s4:
+        st.markdown(
+            """
 <div class="nb-note">
 <b>Learning outcome:</b> You can explain why safety scoring exists, what inputs influence risk, and how to reduce risk logically.
 You also learn to talk about safety in a professional way (not fear-based, but evidence-based).
 </div>
-""",
-        unsafe_allow_html=True,
-    )
 
-    st.markdown(
-        """
 ### Why this module exists
 In real research, safety is not optional.
 Even if a design delivers well, it can fail due to toxicity, immune response, or off-target accumulation.
@@ -1208,43 +1259,38 @@ Write a small safety plan:
 - “Risk contributors: ________”
 - “Change we will try: ________”
 - “Expected outcome: lower risk score with minimal loss of tissue delivery”
-"""
-    )
 
-    st.markdown(
-        """
 <div class="nb-callout-warn">
 <b>Professional language tip:</b> Avoid absolute claims like “This is safe.”  
 Better: “This design shows a lower heuristic risk score under the current assumptions; further validation is needed.”
 </div>
-""",
-        unsafe_allow_html=True,
-    )
 
-    st.markdown("### Checkpoints")
-    section_check("S4", "chk_1", "I ran safety scoring for baseline and modified design.")
-    section_check("S4", "chk_2", "I identified 1–2 drivers of risk.")
-    section_check("S4", "chk_3", "I proposed a clear change to reduce risk.")
+### Checkpoints
+""",
+            unsafe_allow_html=True,
+        )
+        with st.form(key="tut_form_chk_s4", border=False):
+            section_check("S4", "chk_1", "I ran safety scoring for baseline and modified design.")
+            section_check("S4", "chk_2", "I identified 1–2 drivers of risk.")
+            section_check("S4", "chk_3", "I proposed a clear change to reduce risk.")
+            st.form_submit_button("Save checklist", key="tut_btn_chk_s4")
 
-    render_quiz_block("Toxicity & Safety Quiz (Section 4)", QUIZZES["S4"])
+        render_quiz_block("Toxicity & Safety Quiz (Section 4)", QUIZZES["S4"])
 
 
 # ======================================================================
 # SECTION 5 — Cost Estimator
 # ======================================================================
-with st.expander("5) Cost Estimator — Thinking like a project leader 💰", expanded=False):
-    st.markdown(
-        """
+_exp_s5 = st.expander("5) Cost Estimator — Thinking like a project leader 💰", expanded=False, key="tut_exp_s5", on_change="rerun")
+if _exp_s5.open:
+    with _exp_s5:
+        st.markdown(
+            """
 <div class="nb-note">
 <b>Learning outcome:</b> You can interpret cost results correctly as relative complexity, and explain what increases cost.
 You can also suggest a cost-limited design strategy.
 </div>
-""",
-        unsafe_allow_html=True,
-    )
 
-    st.markdown(
-        """
 ### Why this module exists
 In real life, the “best design on paper” can fail if it is:
 - too expensive to produce
@@ -1282,43 +1328,38 @@ Write two choices that keep cost/complexity under control:
 - keep materials common
 - avoid multi-layer complexity
 - avoid extreme precision requirements
-"""
-    )
 
-    st.markdown(
-        """
 <div class="nb-callout-good">
 <b>UAE context:</b> When presenting to sponsors or institutions, the ability to explain feasibility and scaling is highly respected.
 Cost thinking is part of professional research maturity.
 </div>
-""",
-        unsafe_allow_html=True,
-    )
 
-    st.markdown("### Checkpoints")
-    section_check("S5", "chk_1", "I ran cost estimation for baseline and modified designs.")
-    section_check("S5", "chk_2", "I can explain why cost/complexity changed.")
-    section_check("S5", "chk_3", "I suggested at least one cost-limiting design decision.")
+### Checkpoints
+""",
+            unsafe_allow_html=True,
+        )
+        with st.form(key="tut_form_chk_s5", border=False):
+            section_check("S5", "chk_1", "I ran cost estimation for baseline and modified designs.")
+            section_check("S5", "chk_2", "I can explain why cost/complexity changed.")
+            section_check("S5", "chk_3", "I suggested at least one cost-limiting design decision.")
+            st.form_submit_button("Save checklist", key="tut_btn_chk_s5")
 
-    render_quiz_block("Cost Estimator Quiz (Section 5)", QUIZZES["S5"])
+        render_quiz_block("Cost Estimator Quiz (Section 5)", QUIZZES["S5"])
 
 
 # ======================================================================
 # SECTION 6 — Protocol Generator
 # ======================================================================
-with st.expander("6) Protocol Generator — Turning design into an experiment plan 🧾", expanded=False):
-    st.markdown(
-        """
+_exp_s6 = st.expander("6) Protocol Generator — Turning design into an experiment plan 🧾", expanded=False, key="tut_exp_s6", on_change="rerun")
+if _exp_s6.open:
+    with _exp_s6:
+        st.markdown(
+            """
 <div class="nb-note">
 <b>Learning outcome:</b> You can generate a protocol outline and understand what it contains: steps, checkpoints, controls, and measurements.
 You also learn how to use protocols to communicate professionally.
 </div>
-""",
-        unsafe_allow_html=True,
-    )
 
-    st.markdown(
-        """
 ### Why this module exists
 A nanoparticle “design” is not enough.
 In research, you need a plan to test it.
@@ -1365,42 +1406,37 @@ After generating a protocol:
   - what you measure
   - why you measure it
   - what “good” might look like
-"""
-    )
 
-    st.markdown(
-        """
 <div class="nb-callout-warn">
 <b>Reminder:</b> Protocol generator is an educational assistant. Real labs must follow institutional SOPs, safety standards, and approvals.
 </div>
-""",
-        unsafe_allow_html=True,
-    )
 
-    st.markdown("### Checkpoints")
-    section_check("S6", "chk_1", "I generated a protocol outline and reviewed it.")
-    section_check("S6", "chk_2", "I identified at least 3 checkpoints/measurements.")
-    section_check("S6", "chk_3", "I ensured controls and recording steps are included or added notes about them.")
+### Checkpoints
+""",
+            unsafe_allow_html=True,
+        )
+        with st.form(key="tut_form_chk_s6", border=False):
+            section_check("S6", "chk_1", "I generated a protocol outline and reviewed it.")
+            section_check("S6", "chk_2", "I identified at least 3 checkpoints/measurements.")
+            section_check("S6", "chk_3", "I ensured controls and recording steps are included or added notes about them.")
+            st.form_submit_button("Save checklist", key="tut_btn_chk_s6")
 
-    render_quiz_block("Protocol Generator Quiz (Section 6)", QUIZZES["S6"])
+        render_quiz_block("Protocol Generator Quiz (Section 6)", QUIZZES["S6"])
 
 
 # ======================================================================
 # SECTION 7 — AI Co-Designer
 # ======================================================================
-with st.expander("7) AI Co-Designer — Scenario mode, explainability, and governance 🤖📋", expanded=False):
-    st.markdown(
-        """
+_exp_s7 = st.expander("7) AI Co-Designer — Scenario mode, explainability, and governance 🤖📋", expanded=False, key="tut_exp_s7", on_change="rerun")
+if _exp_s7.open:
+    with _exp_s7:
+        st.markdown(
+            """
 <div class="nb-note">
 <b>Learning outcome:</b> You can use AI responsibly to explore options under constraints, compare reasoning, and generate explainable evidence.
 You also learn to treat AI suggestions as proposals to review, not commands to follow.
 </div>
-""",
-        unsafe_allow_html=True,
-    )
 
-    st.markdown(
-        """
 ### Why AI Co-Designer exists
 Manual design is powerful, but it can be slow.
 AI can help you:
@@ -1468,44 +1504,39 @@ Fix: treat AI as a brainstorming partner. Final decision is human-reviewed.
 ### Mini exercise: Scenario writing
 Write a scenario prompt in your own words:
 - “We are a student lab in UAE. We want safe, feasible nanoparticles for target X, with limited budget. Propose 2 options and explain trade-offs.”
-"""
-    )
 
-    st.markdown(
-        """
 <div class="nb-callout-good">
 <b>Governance mindset:</b> The goal is not to “prove AI is right”.
 The goal is to show transparent reasoning, review, and responsible decision-making.
 </div>
-""",
-        unsafe_allow_html=True,
-    )
 
-    st.markdown("### Checkpoints")
-    section_check("S7", "chk_1", "I ran AI Co-Designer in at least one scenario.")
-    section_check("S7", "chk_2", "I compared AI suggestion against my manual baseline.")
-    section_check("S7", "chk_3", "I can explain one AI trade-off in my own words (not copy-paste).")
-    section_check("S7", "chk_4", "I understand why audit/export can be important in universities and government-funded programs.")
+### Checkpoints
+""",
+            unsafe_allow_html=True,
+        )
+        with st.form(key="tut_form_chk_s7", border=False):
+            section_check("S7", "chk_1", "I ran AI Co-Designer in at least one scenario.")
+            section_check("S7", "chk_2", "I compared AI suggestion against my manual baseline.")
+            section_check("S7", "chk_3", "I can explain one AI trade-off in my own words (not copy-paste).")
+            section_check("S7", "chk_4", "I understand why audit/export can be important in universities and government-funded programs.")
+            st.form_submit_button("Save checklist", key="tut_btn_chk_s7")
 
-    render_quiz_block("AI Co-Designer Quiz (Section 7)", QUIZZES["S7"])
+        render_quiz_block("AI Co-Designer Quiz (Section 7)", QUIZZES["S7"])
 
 
 # ======================================================================
 # SECTION 8 — Integrated Workflow + AI vs Manual Baseline
 # ======================================================================
-with st.expander("8) Full Workflow — From idea to protocol + baseline comparison 🧭", expanded=False):
-    st.markdown(
-        """
+_exp_s8 = st.expander("8) Full Workflow — From idea to protocol + baseline comparison 🧭", expanded=False, key="tut_exp_s8", on_change="rerun")
+if _exp_s8.open:
+    with _exp_s8:
+        st.markdown(
+            """
 <div class="nb-note">
 <b>Learning outcome:</b> You can perform the full flow in the app and produce a clean “student deliverable”:
 design summary + simulation interpretation + safety + cost + protocol + AI baseline comparison.
 </div>
-""",
-        unsafe_allow_html=True,
-    )
 
-    st.markdown(
-        """
 ### The full NanoBio Studio student workflow (recommended)
 Follow this sequence (and keep your work clean):
 
@@ -1566,25 +1597,23 @@ Try writing your report as:
 5) Safety + cost notes
 6) Protocol highlights
 7) AI baseline comparison
-"""
-    )
 
-    st.markdown(
-        """
 <div class="nb-callout-good">
 <b>Excellent habit:</b> Treat your work like a mini research memo. Clear structure often matters as much as the final numbers.
 </div>
-""",
-        unsafe_allow_html=True,
-    )
-
-    st.markdown("### Checkpoints")
-    section_check("S8", "chk_1", "I completed the full workflow at least once (baseline + modified).")
-    section_check("S8", "chk_2", "I created a clean summary of results (not messy screenshots only).")
-    section_check("S8", "chk_3", "I can explain at least one trade-off clearly.")
-    section_check("S8", "chk_4", "I understand why manual baseline remains valuable even with AI.")
 
-    render_quiz_block("Integrated Workflow Quiz (Section 8)", QUIZZES["S8"])
+### Checkpoints
+""",
+            unsafe_allow_html=True,
+        )
+        with st.form(key="tut_form_chk_s8", border=False):
+            section_check("S8", "chk_1", "I completed the full workflow at least once (baseline + modified).")
+            section_check("S8", "chk_2", "I created a clean summary of results (not messy screenshots only).")
+            section_check("S8", "chk_3", "I can explain at least one trade-off clearly.")
+            section_check("S8", "chk_4", "I understand why manual baseline remains valuable even with AI.")
+            st.form_submit_button("Save checklist", key="tut_btn_chk_s8")
+
+        render_quiz_block("Integrated Workflow Quiz (Section 8)", QUIZZES["S8"])
 
 
 # ======================================================================
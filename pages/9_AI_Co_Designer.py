@@ -27,7 +27,7 @@ from nanobio_studio.ui.components.charts import pareto_scatter
 from nanobio_studio.ai_engine.simulator_adapter import simulate_design_placeholder
 from nanobio_studio.ai_engine.objectives import efficacy_proxy
 from nanobio_studio.ai_engine.toxicity import toxicity_score_hybrid
-from nanobio_studio.ai_engine.cost import cost_score_proxy
+from nanobio_studio.ai_engine.cost import cost_scores
 
 # Phase-2 Explainability
 from nanobio_studio.ai_engine.explainability import explain_design
@@ -180,14 +180,15 @@ def render_ai_vs_manual_baseline(res, space, weights, simulate_fn, n_baseline: i
             extra={},
         )
 
+    base_designs = [sample_random_design() for _ in range(int(n_baseline))]
+    base_costs = cost_scores(base_designs)
+
     base_rows = []
-    for _ in range(int(n_baseline)):
-        d = sample_random_design()
+    for d, cost in zip(base_designs, base_costs.tolist()):
         sim = simulate_fn(d)
         eff = float(efficacy_proxy(sim))
         tox, _ = toxicity_score_hybrid(d, sim)
         tox = float(tox)
-        cost = float(cost_score_proxy(d))
         score = (w.efficacy * eff) - (w.safety * tox) - (w.cost * cost)
         base_rows.append({"eff": eff, "tox": tox, "cost": cost, "score": score})
 
@@ -6,11 +6,14 @@
 import streamlit as st
 from models import (
     SessionLocal, DesignRepository, ProjectRepository, 
-    OptimizationRepository, Design, Project
+    OptimizationRepository, Design, Project, init_db
 )
 from datetime import datetime
 import pandas as pd
 
+# Make sure the schema exists before any repository call (cached per process)
+init_db()
+
 # ============================================================
 # Session Management
 # ============================================================